@@ -2,7 +2,9 @@
 Game Configuration - Constants and settings
 """
 
+import math
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
 # Display settings
@@ -115,6 +117,20 @@ TOWER_CONFIG = {
     }
 }
 
+
+@dataclass(frozen=True)
+class TowerCfg:
+    """Immutable per-type tower stats (attribute access instead of dict lookups)"""
+    cost: int
+    range: float
+    damage: float
+    attack_speed: float
+    description: str
+    hotkey: str
+
+
+TOWER_CFGS = {name: TowerCfg(**cfg) for name, cfg in TOWER_CONFIG.items()}
+
 # Wave configuration
 WAVE_CONFIG = [
     # Wave 1: Introduction
@@ -180,55 +196,177 @@ MAX_TOWERS = 50
 # Game rules
 ENTANGLEMENT_PROBABILITY = 0.3  # 30% chance for enemy pairs
 DECOHERENCE_RATE = 0.05  # Quantum coherence loss per unmeasured enemy per second
+MIN_DISTANCE_FROM_PATH = 30  # Towers must be at least this far from any path
+
+def _build_path_cache(path: List[Tuple[float, float]]) -> Dict[str, np.ndarray]:
+    """Precompute segment geometry (deltas, lengths, cumulative lengths) for a path"""
+    # float32 is plenty for pixel coordinates and halves memory traffic
+    pts = np.asarray(path, dtype=np.float32)
+    deltas = np.diff(pts, axis=0)
+    seg_len = np.hypot(deltas[:, 0], deltas[:, 1])
+    cum = np.concatenate((np.zeros(1, dtype=np.float32), np.cumsum(seg_len)))
+    return {
+        'pts': pts,
+        'deltas': deltas,
+        'seg_len': seg_len,
+        'cum': cum,
+        'total': float(cum[-1]),
+    }
+
+# Paths never change, so segment geometry is computed once at import time
+_PATH_CACHE = [_build_path_cache(path) for path in PATHS]
+
+def _stack_path_caches(caches: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Pad per-path geometry into rectangular arrays for batched lookups"""
+    max_segments = max(len(c['seg_len']) for c in caches)
+    num = len(caches)
+    pts = np.zeros((num, max_segments + 1, 2), dtype=np.float32)
+    deltas = np.zeros((num, max_segments, 2), dtype=np.float32)
+    seg_len = np.ones((num, max_segments), dtype=np.float32)  # Padding of 1 avoids division by zero
+    cum = np.full((num, max_segments + 1), np.inf, dtype=np.float32)  # Padding never counts as reached
+    for i, c in enumerate(caches):
+        n = len(c['seg_len'])
+        pts[i, :n + 1] = c['pts']
+        deltas[i, :n] = c['deltas']
+        seg_len[i, :n] = c['seg_len']
+        cum[i, :n + 1] = c['cum']
+    return {
+        'pts': pts,
+        'deltas': deltas,
+        'seg_len': seg_len,
+        'cum': cum,
+        'total': np.array([c['total'] for c in caches], dtype=np.float32),
+        'num_segments': np.array([len(c['seg_len']) for c in caches]),
+    }
+
+_PATH_TABLE = _stack_path_caches(_PATH_CACHE)
 
 def get_path_length(path_index: int) -> float:
     """Calculate total length of a path"""
-    path = PATHS[path_index]
-    total_length = 0.0
-    for i in range(len(path) - 1):
-        dx = path[i+1][0] - path[i][0]
-        dy = path[i+1][1] - path[i][1]
-        total_length += np.sqrt(dx*dx + dy*dy)
-    return total_length
+    return _PATH_CACHE[path_index]['total']
 
-def get_position_on_path(path_index: int, progress: float) -> Tuple[float, float]:
+def get_position_on_path_xy(path_index: int, progress: float, out: np.ndarray) -> np.ndarray:
     """
-    Get (x, y) position on path given progress (0.0 to 1.0)
+    Write (x, y) position on path into a caller-supplied buffer
     
     Args:
         path_index: Index of the path
         progress: Progress along path (0.0 = start, 1.0 = end)
+        out: Float array of shape (2,) that receives the position
         
     Returns:
-        (x, y) tuple
+        out, for chaining
     """
-    path = PATHS[path_index]
+    cache = _PATH_CACHE[path_index]
+    pts = cache['pts']
     if progress <= 0:
-        return path[0]
+        out[:] = pts[0]
+        return out
     if progress >= 1:
-        return path[-1]
+        out[:] = pts[-1]
+        return out
+    
+    target_distance = progress * cache['total']
+    
+    # Binary search for the segment containing target distance
+    i = int(np.searchsorted(cache['cum'], target_distance)) - 1
+    i = min(max(i, 0), len(cache['seg_len']) - 1)
     
-    # Calculate total path length
-    total_length = get_path_length(path_index)
-    target_distance = progress * total_length
+    # Interpolate within this segment: out = p0 + t * (p1 - p0)
+    segment_progress = (target_distance - cache['cum'][i]) / cache['seg_len'][i]
+    np.multiply(cache['deltas'][i], segment_progress, out=out)
+    out += pts[i]
+    return out
+
+_POSITION_SCRATCH = np.empty(2, dtype=np.float32)
+
+def get_position_on_path(path_index: int, progress: float) -> Tuple[float, float]:
+    """
+    Get (x, y) position on path given progress (0.0 to 1.0)
     
-    # Find segment containing target distance
-    current_distance = 0.0
-    for i in range(len(path) - 1):
-        dx = path[i+1][0] - path[i][0]
-        dy = path[i+1][1] - path[i][1]
-        segment_length = np.sqrt(dx*dx + dy*dy)
+    Args:
+        path_index: Index of the path
+        progress: Progress along path (0.0 = start, 1.0 = end)
         
-        if current_distance + segment_length >= target_distance:
-            # Interpolate within this segment
-            segment_progress = (target_distance - current_distance) / segment_length
-            x = path[i][0] + dx * segment_progress
-            y = path[i][1] + dy * segment_progress
-            return (x, y)
+    Returns:
+        (x, y) tuple
+    """
+    x, y = get_position_on_path_xy(path_index, progress, _POSITION_SCRATCH)
+    return (float(x), float(y))
+
+def get_positions_on_paths(path_indices: np.ndarray, progress: np.ndarray) -> np.ndarray:
+    """
+    Get (x, y) positions for many (path, progress) pairs in one vectorized pass
+    
+    Args:
+        path_indices: Integer array of path indices, shape (N,)
+        progress: Progress along each path (0.0 to 1.0), shape (N,)
         
-        current_distance += segment_length
+    Returns:
+        Array of positions, shape (N, 2)
+    """
+    path_indices = np.asarray(path_indices, dtype=np.intp)
+    progress = np.clip(np.asarray(progress, dtype=np.float32), 0.0, 1.0)
+    table = _PATH_TABLE
+    
+    targets = progress * table['total'][path_indices]
     
-    return path[-1]
+    # Row-wise searchsorted: count cumulative lengths strictly below target
+    cum = table['cum'][path_indices]
+    k = (cum < targets[:, None]).sum(axis=1) - 1
+    k = np.clip(k, 0, table['num_segments'][path_indices] - 1)
+    
+    # Gather segment data and interpolate
+    cum_k = cum[np.arange(len(k)), k]
+    t = (targets - cum_k) / table['seg_len'][path_indices, k]
+    return table['pts'][path_indices, k] + table['deltas'][path_indices, k] * t[:, None]
+
+# Positions sampled at evenly spaced progress values, shape (NUM_PATHS, PATH_LUT_SAMPLES, 2)
+PATH_LUT_SAMPLES = 2048
+PATH_LUT = np.ascontiguousarray(
+    get_positions_on_paths(
+        np.repeat(np.arange(NUM_PATHS), PATH_LUT_SAMPLES),
+        np.tile(np.linspace(0.0, 1.0, PATH_LUT_SAMPLES), NUM_PATHS)
+    ).reshape(NUM_PATHS, PATH_LUT_SAMPLES, 2),
+    dtype=np.float32
+)
+
+def get_positions_from_lut(path_indices: np.ndarray, progress: np.ndarray) -> np.ndarray:
+    """
+    Get (x, y) positions by interpolating between PATH_LUT samples
+    
+    Cheaper than get_positions_on_paths (a single gather, no segment search)
+    at the cost of cutting path corners by under a pixel.
+    
+    Args:
+        path_indices: Integer array of path indices, shape (N,)
+        progress: Progress along each path (0.0 to 1.0), shape (N,)
+        
+    Returns:
+        Array of positions, shape (N, 2)
+    """
+    last = PATH_LUT_SAMPLES - 1
+    f = np.clip(np.asarray(progress, dtype=np.float32), 0.0, 1.0) * last
+    k = np.minimum(f.astype(np.intp), last - 1)
+    t = (f - k)[:, None]
+    p0 = PATH_LUT[path_indices, k]
+    return p0 + (PATH_LUT[path_indices, k + 1] - p0) * t
+
+def _build_path_segments(path: List[Tuple[float, float]]) -> Dict[str, np.ndarray]:
+    """Segment endpoint arrays and inflated bounding box for vectorized distance tests"""
+    pts = np.asarray(path, dtype=np.float64)
+    p0 = pts[:-1]
+    d = pts[1:] - p0
+    xmin, ymin = pts.min(axis=0) - MIN_DISTANCE_FROM_PATH
+    xmax, ymax = pts.max(axis=0) + MIN_DISTANCE_FROM_PATH
+    return {
+        'p0': p0,
+        'd': d,
+        'len2': (d * d).sum(axis=1),
+        'bbox': (float(xmin), float(ymin), float(xmax), float(ymax)),
+    }
+
+_PATH_SEGMENTS = [_build_path_segments(path) for path in PATHS]
 
 def is_valid_tower_placement(position: Tuple[float, float]) -> bool:
     """
@@ -240,15 +378,23 @@ def is_valid_tower_placement(position: Tuple[float, float]) -> bool:
     Returns:
         True if valid placement
     """
-    MIN_DISTANCE_FROM_PATH = 30
+    px, py = position
+    min_d2 = MIN_DISTANCE_FROM_PATH ** 2
     
-    # Check distance from all path segments
-    for path in PATHS:
-        for i in range(len(path) - 1):
-            # Check distance to line segment
-            dist = point_to_segment_distance(position, path[i], path[i+1])
-            if dist < MIN_DISTANCE_FROM_PATH:
-                return False
+    for seg in _PATH_SEGMENTS:
+        # Skip paths whose inflated bounding box doesn't contain the point
+        xmin, ymin, xmax, ymax = seg['bbox']
+        if px < xmin or px > xmax or py < ymin or py > ymax:
+            continue
+        
+        # Distance from point to every segment of this path at once (squared, no sqrt)
+        v = np.array((px, py), dtype=np.float64) - seg['p0']
+        t = np.divide((v * seg['d']).sum(axis=1), seg['len2'],
+                      out=np.zeros(len(seg['len2'])), where=seg['len2'] > 0)
+        t = np.clip(t, 0.0, 1.0)
+        diff = v - t[:, None] * seg['d']
+        if ((diff * diff).sum(axis=1) < min_d2).any():
+            return False
     
     return True
 
@@ -264,11 +410,13 @@ def point_to_segment_distance(point: Tuple[float, float],
     dy = y2 - y1
     
     if dx == 0 and dy == 0:
-        return np.sqrt((px - x1)**2 + (py - y1)**2)
+        ex, ey = px - x1, py - y1
+        return math.sqrt(ex * ex + ey * ey)
     
     t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx*dx + dy*dy)))
     
     proj_x = x1 + t * dx
     proj_y = y1 + t * dy
     
-    return np.sqrt((px - proj_x)**2 + (py - proj_y)**2)
+    ex, ey = px - proj_x, py - proj_y
+    return math.sqrt(ex * ex + ey * ey)
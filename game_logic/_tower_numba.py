@@ -0,0 +1,53 @@
+"""
+Tower Kernels - JIT-compiled per-frame tower targeting math
+Falls back to plain Python when Numba is not installed
+"""
+
+import numpy as np
+
+from config._numba_compat import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _find_hits(tower_xy, range2, enemy_xy, enemy_alive, max_targets):
+    """
+    Find enemies within range of every tower
+
+    Args:
+        tower_xy: Tower positions, shape (T, 2)
+        range2: Squared tower ranges, shape (T,)
+        enemy_xy: Candidate enemy positions, shape (N, P, 2)
+                  (one per possible path, repeated for measured enemies)
+        enemy_alive: Alive mask, shape (N,)
+        max_targets: Maximum targets reported per tower
+
+    Returns:
+        (tower_idx, enemy_idx) arrays of hits, in enemy order per tower
+    """
+    n_towers = tower_xy.shape[0]
+    n_enemies = enemy_xy.shape[0]
+    n_candidates = enemy_xy.shape[1]
+
+    tower_idx = np.empty(n_towers * max_targets, dtype=np.int64)
+    enemy_idx = np.empty(n_towers * max_targets, dtype=np.int64)
+    k = 0
+
+    for t in range(n_towers):
+        found = 0
+        for e in range(n_enemies):
+            if found == max_targets:
+                break
+            if not enemy_alive[e]:
+                continue
+            for c in range(n_candidates):
+                dx = enemy_xy[e, c, 0] - tower_xy[t, 0]
+                dy = enemy_xy[e, c, 1] - tower_xy[t, 1]
+                if dx * dx + dy * dy <= range2[t]:
+                    tower_idx[k] = t
+                    enemy_idx[k] = e
+                    k += 1
+                    found += 1
+                    break  # Only add once
+
+    return tower_idx[:k], enemy_idx[:k]
+
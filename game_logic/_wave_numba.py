@@ -0,0 +1,77 @@
+"""
+Wave Kernels - JIT-compiled per-frame enemy math
+Falls back to plain Python when Numba is not installed
+"""
+
+from config._numba_compat import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True, fastmath=True)
+def enemies_in_range_kernel(progress, is_measured, measured_path, qx, qy, r2, path_lut, out_mask):
+    """
+    Flag enemies with any possible position within range of a point
+
+    Args:
+        progress: Enemy progress along path, shape (N,)
+        is_measured: Measured flags, shape (N,)
+        measured_path: Collapsed path per enemy, shape (N,)
+        qx, qy: Query point
+        r2: Squared range
+        path_lut: Sampled path positions, shape (P, S, 2)
+        out_mask: Output mask, shape (N,); written in place
+    """
+    n_paths = path_lut.shape[0]
+    last = path_lut.shape[1] - 1
+
+    for i in range(progress.shape[0]):
+        # Interpolate between the two nearest samples
+        f = min(max(progress[i], 0.0), 1.0) * last
+        k = min(int(f), last - 1)
+        t = f - k
+        out_mask[i] = False
+
+        if is_measured[i]:
+            p = measured_path[i]
+            x = path_lut[p, k, 0] + (path_lut[p, k + 1, 0] - path_lut[p, k, 0]) * t
+            y = path_lut[p, k, 1] + (path_lut[p, k + 1, 1] - path_lut[p, k, 1]) * t
+            dx = x - qx
+            dy = y - qy
+            out_mask[i] = dx * dx + dy * dy <= r2
+        else:
+            for p in range(n_paths):
+                x = path_lut[p, k, 0] + (path_lut[p, k + 1, 0] - path_lut[p, k, 0]) * t
+                y = path_lut[p, k, 1] + (path_lut[p, k + 1, 1] - path_lut[p, k, 1]) * t
+                dx = x - qx
+                dy = y - qy
+                if dx * dx + dy * dy <= r2:
+                    out_mask[i] = True
+                    break  # Only add once
+
+
+@njit(cache=True, fastmath=True)
+def tick_enemies(progress, speed, health, dt, dead_idx, end_idx):
+    """
+    Advance enemies and collect the dead and those at the end in one pass
+
+    Args:
+        progress: Enemy progress along path, shape (N,); updated in place
+        speed: Enemy speed, shape (N,)
+        health: Enemy health, shape (N,)
+        dt: Time step (seconds)
+        dead_idx: Output buffer for indices of dead enemies, shape >= (N,)
+        end_idx: Output buffer for indices of living enemies at the end, shape >= (N,)
+
+    Returns:
+        (n_dead, n_end) counts written to the buffers, in ascending index order
+    """
+    n_dead = 0
+    n_end = 0
+    for i in range(progress.shape[0]):
+        progress[i] += speed[i] * dt
+        if health[i] <= 0:
+            dead_idx[n_dead] = i
+            n_dead += 1
+        elif progress[i] >= 1.0:
+            end_idx[n_end] = i
+            n_end += 1
+    return n_dead, n_end
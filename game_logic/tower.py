@@ -3,14 +3,43 @@ Tower System - Measurement towers and quantum effects
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from enum import IntEnum
+from typing import Dict, List, Tuple, Optional
 import numpy as np
+from scipy.spatial import cKDTree
 from qiskit import QuantumCircuit
 import logging
+from config.game_config import (
+    NUM_PATHS, MAX_TOWERS, TOWER_CFGS, get_position_on_path_xy,
+    get_positions_on_paths, get_positions_from_lut
+)
+from quantum_engine.quantum_worker import QuantumWorker
+from ._tower_numba import NUMBA_AVAILABLE, _find_hits
 
 logger = logging.getLogger(__name__)
 
 
+class TType(IntEnum):
+    """Integer tower type codes (per-frame arrays and handler dispatch)"""
+    MEASUREMENT = 0
+    PHASE = 1
+    ENT = 2
+    TELE = 3
+
+
+# Tower types that do nothing at all while on cooldown
+_COOLDOWN_GATED = (TType.MEASUREMENT, TType.TELE)
+
+# Per-type invariants, computed once and shared by every tower of that type
+_PERIOD = {name: 1.0 / cfg.attack_speed for name, cfg in TOWER_CFGS.items()}
+_RANGE2 = {name: cfg.range ** 2 for name, cfg in TOWER_CFGS.items()}
+
+MAX_TARGETS = 3
+
+# Below this many live enemies, brute force beats building a KD-tree
+KDTREE_MIN_ENEMIES = 16
+
+
 @dataclass
 class Tower:
     """Base tower class"""
@@ -23,10 +52,21 @@ class Tower:
     attack_speed: float  # Attacks per second
     cost: int
     last_attack_time: float
+    slot: int = -1  # Row in TowerManager's per-tower arrays
+    
+    @property
+    def range2(self) -> float:
+        """Squared range for sqrt-free distance checks"""
+        return _RANGE2[self.tower_type]
+    
+    @property
+    def attack_period(self) -> float:
+        """Seconds between attacks"""
+        return _PERIOD[self.tower_type]
     
     def can_attack(self, current_time: float) -> bool:
         """Check if tower can attack based on attack speed"""
-        return (current_time - self.last_attack_time) >= (1.0 / self.attack_speed)
+        return (current_time - self.last_attack_time) >= _PERIOD[self.tower_type]
     
     def update_attack_time(self, current_time: float):
         """Update last attack time"""
@@ -38,15 +78,18 @@ class MeasurementTower(Tower):
     Measurement tower - collapses enemy superposition
     """
     
+    _ttype = TType.MEASUREMENT
+    
     def __init__(self, tower_id: int, position: Tuple[float, float]):
+        cfg = TOWER_CFGS["measurement"]
         super().__init__(
             tower_id=tower_id,
             tower_type="measurement",
             position=position,
-            range=150.0,
-            damage=20.0,
-            attack_speed=1.0,
-            cost=100,
+            range=cfg.range,
+            damage=cfg.damage,
+            attack_speed=cfg.attack_speed,
+            cost=cfg.cost,
             last_attack_time=0.0
         )
         self.collapse_preference = None  # Which path to bias measurement toward
@@ -100,15 +143,18 @@ class PhaseTower(Tower):
     Reduces probability of enemy being on targeted path
     """
     
+    _ttype = TType.PHASE
+    
     def __init__(self, tower_id: int, position: Tuple[float, float], target_path: int):
+        cfg = TOWER_CFGS["phase"]
         super().__init__(
             tower_id=tower_id,
             tower_type="phase",
             position=position,
-            range=120.0,
-            damage=0.0,  # Doesn't deal direct damage
-            attack_speed=0.5,
-            cost=150,
+            range=cfg.range,
+            damage=cfg.damage,  # Doesn't deal direct damage
+            attack_speed=cfg.attack_speed,
+            cost=cfg.cost,
             last_attack_time=0.0
         )
         self.target_path = target_path
@@ -124,9 +170,9 @@ class PhaseTower(Tower):
         if enemy.is_measured:
             return  # Can't affect measured enemies
         
-        # Apply phase rotation to target path
-        enemy.quantum_circuit = quantum_state_manager.apply_phase_gate(
-            enemy.quantum_circuit,
+        # Apply phase rotation to target path (circuit is modified in place)
+        quantum_state_manager.apply_phase_gate(
+            enemy.writable_circuit(),
             self.target_path,
             self.phase_angle
         )
@@ -139,15 +185,18 @@ class EntanglementTower(Tower):
     Entanglement tower - creates damage correlation between nearby enemies
     """
     
+    _ttype = TType.ENT
+    
     def __init__(self, tower_id: int, position: Tuple[float, float]):
+        cfg = TOWER_CFGS["entanglement"]
         super().__init__(
             tower_id=tower_id,
             tower_type="entanglement",
             position=position,
-            range=100.0,
-            damage=15.0,
-            attack_speed=0.75,
-            cost=200,
+            range=cfg.range,
+            damage=cfg.damage,
+            attack_speed=cfg.attack_speed,
+            cost=cfg.cost,
             last_attack_time=0.0
         )
     
@@ -176,20 +225,24 @@ class TeleportationTower(Tower):
     Uses quantum teleportation protocol
     """
     
+    _ttype = TType.TELE
+    
     def __init__(self, tower_id: int, position: Tuple[float, float],
                  target_position: Tuple[float, float]):
+        cfg = TOWER_CFGS["teleportation"]
         super().__init__(
             tower_id=tower_id,
             tower_type="teleportation",
             position=position,
-            range=80.0,
-            damage=30.0,
-            attack_speed=0.5,
-            cost=250,
+            range=cfg.range,
+            damage=cfg.damage,
+            attack_speed=cfg.attack_speed,
+            cost=cfg.cost,
             last_attack_time=0.0
         )
         self.target_position = target_position  # Where damage appears
         self.teleport_range = 100.0  # Range at target position
+        self.teleport_range2 = self.teleport_range ** 2
     
     def teleport_attack(self, enemy, current_time: float) -> float:
         """
@@ -204,12 +257,10 @@ class TeleportationTower(Tower):
         if enemy_pos is None:
             return 0.0
         
-        distance = np.sqrt(
-            (enemy_pos[0] - self.target_position[0])**2 +
-            (enemy_pos[1] - self.target_position[1])**2
-        )
+        dx = enemy_pos[0] - self.target_position[0]
+        dy = enemy_pos[1] - self.target_position[1]
         
-        if distance <= self.teleport_range:
+        if dx*dx + dy*dy <= self.teleport_range2:
             damage_dealt = enemy.take_damage(self.damage)
             self.update_attack_time(current_time)
             return damage_dealt
@@ -227,8 +278,51 @@ class TowerManager:
     
     def __init__(self, quantum_state_manager):
         self.towers: List[Tower] = []
+        self._id_to_idx: Dict[int, int] = {}  # tower_id -> index in self.towers
         self.quantum_state_manager = quantum_state_manager
         self.next_tower_id = 0
+        self._allocate_arrays(MAX_TOWERS)
+        self.quantum_worker = QuantumWorker(quantum_state_manager)
+        self._measuring: Dict[int, object] = {}  # enemy_id -> enemy with a measurement in flight
+        
+        # Jump table indexed by TType
+        self._handlers = (
+            self.handle_measurement_tower,
+            self.handle_phase_tower,
+            self.handle_entanglement_tower,
+            self.handle_teleportation_tower,
+        )
+    
+    def _allocate_arrays(self, capacity: int):
+        """
+        Allocate per-tower arrays (structure of arrays)
+        
+        Rows are slots; removed towers leave a tombstone so slots stay stable.
+        """
+        self._pos = np.zeros((capacity, 2), dtype=np.float64)
+        self._range2 = np.full(capacity, -1.0)  # Tombstones never reach anything
+        self._damage = np.zeros(capacity, dtype=np.float64)
+        self._atk_period = np.zeros(capacity, dtype=np.float64)
+        self._last_atk = np.zeros(capacity, dtype=np.float64)
+        self._type = np.zeros(capacity, dtype=np.uint8)
+        self._gated = np.zeros(capacity, dtype=np.bool_)
+        self._alive = np.zeros(capacity, dtype=np.bool_)
+        self._slot_towers: List[Optional[Tower]] = [None] * capacity
+        self._num_slots = 0  # High-water mark of used slots
+    
+    def _write_slot(self, slot: int, tower: Tower):
+        """Store tower data in a slot of the per-tower arrays"""
+        tower.slot = slot
+        self._pos[slot] = tower.position
+        self._range2[slot] = tower.range2
+        self._damage[slot] = tower.damage
+        self._atk_period[slot] = tower.attack_period
+        self._last_atk[slot] = tower.last_attack_time
+        self._type[slot] = tower._ttype
+        self._gated[slot] = self._type[slot] in _COOLDOWN_GATED
+        self._alive[slot] = True
+        self._slot_towers[slot] = tower
+        self._num_slots = max(self._num_slots, slot + 1)
     
     def place_tower(self, tower_type: str, position: Tuple[float, float],
                     **kwargs) -> Optional[Tower]:
@@ -243,6 +337,11 @@ class TowerManager:
         Returns:
             Tower object or None if placement failed
         """
+        free_slots = np.flatnonzero(~self._alive)
+        if len(free_slots) == 0:
+            logger.warning(f"Tower limit reached ({MAX_TOWERS})")
+            return None
+        
         tower = None
         
         if tower_type == "measurement":
@@ -257,35 +356,52 @@ class TowerManager:
             tower = TeleportationTower(self.next_tower_id, position, target_pos)
         
         if tower:
+            self._id_to_idx[tower.tower_id] = len(self.towers)
             self.towers.append(tower)
             self.next_tower_id += 1
+            self._write_slot(int(free_slots[0]), tower)
             return tower
         
         return None
     
     def remove_tower(self, tower_id: int):
         """Remove a tower"""
-        self.towers = [t for t in self.towers if t.tower_id != tower_id]
+        j = self._id_to_idx.pop(tower_id, None)
+        if j is None:
+            return
+        tower = self.towers[j]
+        
+        # Tombstone the slot so other towers keep their rows
+        self._alive[tower.slot] = False
+        self._range2[tower.slot] = -1.0
+        self._slot_towers[tower.slot] = None
+        
+        # Swap with last and pop - O(1) instead of rebuilding the list
+        last = self.towers.pop()
+        if last is not tower:
+            self.towers[j] = last
+            self._id_to_idx[last.tower_id] = j
     
     def clear_all_towers(self):
         """Remove all towers from the game"""
         self.towers.clear()
+        self._id_to_idx.clear()
         self.next_tower_id = 0
+        self._allocate_arrays(MAX_TOWERS)
+        
+        # Forget in-flight measurements and discard results that already arrived
+        self._measuring.clear()
+        self.quantum_worker.drain()
         logger.info("All towers cleared")
     
     def get_towers_in_range(self, position: Tuple[float, float]) -> List[Tower]:
         """Get all towers that can reach a position"""
-        in_range = []
-        for tower in self.towers:
-            distance = np.sqrt(
-                (tower.position[0] - position[0])**2 +
-                (tower.position[1] - position[1])**2
-            )
-            if distance <= tower.range:
-                in_range.append(tower)
-        return in_range
+        n = self._num_slots
+        d2 = ((self._pos[:n] - np.asarray(position, dtype=np.float64))**2).sum(axis=1)
+        return [self._slot_towers[i] for i in np.flatnonzero(d2 <= self._range2[:n])]
     
-    def update_all_towers(self, enemies: List, entangled_pairs: List, current_time: float, effects_manager=None):
+    def update_all_towers(self, enemies: List, entangled_pairs: List, current_time: float, effects_manager=None,
+                          enemy_xy: Optional[np.ndarray] = None, enemy_alive: Optional[np.ndarray] = None):
         """
         Update all towers and execute attacks
         
@@ -294,24 +410,162 @@ class TowerManager:
             entangled_pairs: List of entangled enemy pairs
             current_time: Current game time
             effects_manager: Visual effects manager (optional)
+            enemy_xy: Precomputed candidate positions, shape (N, NUM_PATHS, 2),
+                      rows aligned with enemies (optional)
+            enemy_alive: Precomputed alive mask, shape (N,), aligned with
+                         enemies (optional)
         """
+        # Find enemies in range of every tower in one pass
+        n = self._num_slots
+        targets_by_slot = self.find_all_targets(enemies, enemy_xy, enemy_alive)
+        # Cooldowns of all towers in one vectorized comparison
+        ready = (current_time - self._last_atk[:n]) >= self._atk_period[:n]
+        
+        self._submit_measurements(targets_by_slot, ready)
+        
+        handlers = self._handlers
         for tower in self.towers:
-            # Find enemies in range
-            targets = self.find_targets_in_range(tower, enemies)
+            i = tower.slot
+            if self._gated[i] and not ready[i]:
+                continue
+            
+            targets = targets_by_slot[i]
+            
+            handlers[tower._ttype](tower, targets, current_time, effects_manager)
             
-            if tower.tower_type == "measurement":
-                self.handle_measurement_tower(tower, targets, current_time, effects_manager)
-            elif tower.tower_type == "phase":
-                self.handle_phase_tower(tower, targets, current_time, effects_manager)
-            elif tower.tower_type == "entanglement":
-                self.handle_entanglement_tower(tower, targets, effects_manager)
-            elif tower.tower_type == "teleportation":
-                self.handle_teleportation_tower(tower, targets, current_time, effects_manager)
-    
-    def find_targets_in_range(self, tower: Tower, enemies: List) -> List:
-        """Find enemies in tower's range"""
-        # Simplified - in full implementation, check actual positions
-        return [e for e in enemies if e.is_alive()][:3]  # Max 3 targets
+            self._last_atk[i] = tower.last_attack_time
+    
+    def _submit_measurements(self, targets_by_slot: List[List], ready: np.ndarray):
+        """
+        Queue a measurement for every enemy a ready measurement tower wants to collapse
+        
+        All circuits go to the quantum worker as one batch; results are
+        applied by apply_measurements on a later frame.
+        """
+        pending = {}
+        for tower in self.towers:
+            if tower._ttype != TType.MEASUREMENT or not ready[tower.slot]:
+                continue
+            targets = targets_by_slot[tower.slot]
+            if targets and not targets[0].is_measured and targets[0].enemy_id not in self._measuring:
+                pending[targets[0].enemy_id] = targets[0]
+        
+        if not pending:
+            return
+        
+        self._measuring.update(pending)
+        self.quantum_worker.submit_measurements(
+            list(pending.keys()),
+            [enemy.quantum_circuit for enemy in pending.values()]
+        )
+    
+    def apply_measurements(self, effects_manager=None):
+        """
+        Collapse enemies whose measurements came back from the quantum worker
+        
+        Call once per frame before enemy positions are computed, so
+        collapsed enemies are targeted on their measured path.
+        
+        Args:
+            effects_manager: Visual effects manager (optional)
+        """
+        for enemy_id, measured_path in self.quantum_worker.drain():
+            enemy = self._measuring.pop(enemy_id, None)
+            if enemy is None or measured_path is None or enemy.is_measured or not enemy.is_alive():
+                continue
+            enemy.collapse_to_path(measured_path)
+            
+            # ADD EFFECT HERE
+            if effects_manager:
+                pos = get_position_on_path_xy(measured_path, enemy.position_progress, np.empty(2))
+                effects_manager.add_measurement_effect(pos, (100, 255, 100))
+    
+    def shutdown(self):
+        """Stop background quantum work"""
+        self.quantum_worker.shutdown()
+    
+    def _enemy_positions(self, enemies: List) -> np.ndarray:
+        """
+        Get candidate positions of enemies on every path they may occupy
+        
+        Returns:
+            Array of shape (N, NUM_PATHS, 2); measured enemies repeat
+            their collapsed position
+        """
+        n = len(enemies)
+        paths = np.tile(np.arange(NUM_PATHS), (n, 1))
+        for row, enemy in enumerate(enemies):
+            if enemy.is_measured:
+                paths[row] = enemy.measured_path
+        progress = np.array([e.position_progress for e in enemies], dtype=np.float64)
+        
+        xy = get_positions_from_lut(paths.ravel(), np.repeat(progress, NUM_PATHS))
+        return xy.reshape(n, NUM_PATHS, 2)
+    
+    def find_all_targets(self, enemies: List, enemy_xy: Optional[np.ndarray] = None,
+                         enemy_alive: Optional[np.ndarray] = None) -> List[List]:
+        """
+        Find enemies in range of each tower (up to MAX_TARGETS per tower)
+        
+        Args:
+            enemies: List of active enemies
+            enemy_xy: Precomputed candidate positions aligned with enemies (optional)
+            enemy_alive: Precomputed alive mask aligned with enemies (optional)
+        
+        Returns:
+            List of target lists, indexed by tower slot
+        """
+        n = self._num_slots
+        targets = [[] for _ in range(n)]
+        if not self.towers or not enemies:
+            return targets
+        
+        if enemy_alive is None:
+            enemy_alive = np.fromiter((e.is_alive() for e in enemies), dtype=np.bool_, count=len(enemies))
+        n_live = int(np.count_nonzero(enemy_alive))
+        if n_live == 0:
+            return targets
+        if enemy_xy is None:
+            enemy_xy = self._enemy_positions(enemies)
+        
+        if NUMBA_AVAILABLE and n_live < KDTREE_MIN_ENEMIES:
+            # The kernel skips the dead itself, so rows stay aligned with enemies
+            tower_idx, enemy_idx = _find_hits(
+                self._pos[:n], self._range2[:n], enemy_xy, enemy_alive, MAX_TARGETS
+            )
+            for t, e in zip(tower_idx.tolist(), enemy_idx.tolist()):
+                targets[t].append(enemies[e])
+            return targets
+        
+        # Filter the dead once per frame for the array-based searches
+        live_idx = np.flatnonzero(enemy_alive)
+        live = [enemies[i] for i in live_idx.tolist()]
+        enemy_xy = enemy_xy[live_idx]
+        
+        if n_live < KDTREE_MIN_ENEMIES:
+            # Without the JIT, one broadcast (T, N, P) distance test beats a Python loop
+            d = enemy_xy[None, :, :, :] - self._pos[:n, None, None, :]
+            in_range = ((d * d).sum(axis=-1) <= self._range2[:n, None, None]).any(axis=-1)
+            for t in np.flatnonzero(in_range.any(axis=1)).tolist():
+                targets[t] = [live[e] for e in np.flatnonzero(in_range[t])[:MAX_TARGETS].tolist()]
+            return targets
+        
+        # Ball queries against a tree of every candidate position of live enemies
+        tree = cKDTree(enemy_xy.reshape(-1, 2))
+        slots = np.flatnonzero(self._alive[:n])
+        hits = tree.query_ball_point(self._pos[slots], np.sqrt(self._range2[slots]), return_sorted=True)
+        
+        for slot, points in zip(slots.tolist(), hits):
+            # Points are sorted, so enemy order is preserved; drop repeat paths
+            seen = -1
+            for point in points:
+                e = point // NUM_PATHS
+                if e != seen:
+                    targets[slot].append(live[e])
+                    seen = e
+                    if len(targets[slot]) == MAX_TARGETS:
+                        break
+        return targets
     
     def handle_measurement_tower(self, tower: MeasurementTower, targets: List, current_time: float, effects_manager=None):
         """Handle measurement tower logic"""
@@ -320,17 +574,10 @@ class TowerManager:
         
         target = targets[0]
         
-        if current_time - tower.last_attack_time >= 1.0 / tower.attack_speed:
+        if current_time - tower.last_attack_time >= tower.attack_period:
             if not target.is_measured:
-                # Measure
-                measured_path = self.quantum_state_manager.measure_path(target.quantum_circuit)
-                target.collapse_to_path(measured_path)
-                
-                # ADD EFFECT HERE
-                if effects_manager:
-                    from config.game_config import get_position_on_path
-                    pos = get_position_on_path(measured_path, target.position_progress)
-                    effects_manager.add_measurement_effect(pos, (100, 255, 100))
+                # Measurement is in flight on the quantum worker; fire once it lands
+                return
             
             # Deal damage
             damage = tower.damage
@@ -338,8 +585,7 @@ class TowerManager:
             
             # ADD DAMAGE NUMBER
             if effects_manager and actual_damage > 0:
-                from config.game_config import get_position_on_path
-                pos = get_position_on_path(target.measured_path, target.position_progress)
+                pos = get_position_on_path_xy(target.measured_path, target.position_progress, np.empty(2))
                 effects_manager.add_damage_number(pos, int(actual_damage), (255, 100, 100))
             
             tower.last_attack_time = current_time
@@ -352,16 +598,10 @@ class TowerManager:
                 
                 # ADD PHASE EFFECT
                 if effects_manager and current_time - tower.last_attack_time < 0.1:
-                    from config.game_config import get_position_on_path
-                    # Show effect on all possible paths for unmeasured enemy
-                    positions = []
-                    for path_idx in range(4):
-                        pos = get_position_on_path(path_idx, enemy.position_progress)
-                        positions.append(pos)
                     effects_manager.add_phase_shift_effect(tower.position, tower.target_path)
                 break
     
-    def handle_entanglement_tower(self, tower: EntanglementTower, targets: List, effects_manager=None):
+    def handle_entanglement_tower(self, tower: EntanglementTower, targets: List, current_time: float, effects_manager=None):
         """Handle entanglement tower logic"""
         if len(targets) >= 2:
             # Check if targets are not already entangled
@@ -370,21 +610,26 @@ class TowerManager:
                 
                 # ADD ENTANGLEMENT EFFECT
                 if effects_manager:
-                    from config.game_config import get_position_on_path
                     if targets[0].is_measured and targets[1].is_measured:
-                        pos1 = get_position_on_path(targets[0].measured_path, targets[0].position_progress)
-                        pos2 = get_position_on_path(targets[1].measured_path, targets[1].position_progress)
+                        pos1 = get_position_on_path_xy(targets[0].measured_path, targets[0].position_progress, np.empty(2))
+                        pos2 = get_position_on_path_xy(targets[1].measured_path, targets[1].position_progress, np.empty(2))
                         effects_manager.add_entanglement_effect(pos1, pos2, (200, 100, 255))
     
     def handle_teleportation_tower(self, tower: TeleportationTower, targets: List, current_time: float, effects_manager=None):
         """Handle teleportation tower logic"""
-        for enemy in targets:
+        if effects_manager and targets:
+            # Resolve all target positions in one batched lookup
+            positions = get_positions_on_paths(
+                np.array([e.measured_path if e.is_measured else 0 for e in targets]),
+                np.array([e.position_progress for e in targets])
+            )
+        
+        for k, enemy in enumerate(targets):
             damage = tower.teleport_attack(enemy, current_time)
             
             # ADD TELEPORTATION EFFECT
             if effects_manager and damage > 0:
-                from config.game_config import get_position_on_path
                 if enemy.is_measured:
-                    end_pos = get_position_on_path(enemy.measured_path, enemy.position_progress)
+                    end_pos = positions[k]
                     effects_manager.add_teleportation_effect(tower.position, end_pos)
                     effects_manager.add_damage_number(end_pos, int(damage), (100, 255, 255))
@@ -2,14 +2,33 @@
 Wave Manager - Handles enemy wave spawning and management
 """
 
-import time
 import logging
+from collections import deque
 import numpy as np
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from qiskit import QuantumCircuit
+from config.game_config import NUM_PATHS, PATH_LUT, get_positions_from_lut
 from quantum_engine.enemy_superposition import EnemySpawner, EnemySuperposition, EntangledEnemyPair
+from ._wave_numba import NUMBA_AVAILABLE, enemies_in_range_kernel, tick_enemies
 
 logger = logging.getLogger(__name__)
 
+# Per-enemy arrays kept by WaveManager, one row per entry of WaveManager.enemies
+_ENEMY_ARRAYS = ('progress', 'speed', 'health', 'is_measured', 'measured_path', 'type_id')
+INITIAL_ENEMY_CAPACITY = 64
+
+_rng = np.random.default_rng()
+
+
+@dataclass
+class PendingSpawn:
+    """A spawn prepared at wave start: one enemy or an entangled pair"""
+    type_ids: Tuple[int, ...]
+    health: float
+    speed: float
+    entangled_qc: Optional[QuantumCircuit] = None  # Prebuilt for pairs
+
 
 class WaveManager:
     """Manages enemy waves and spawning"""
@@ -27,10 +46,25 @@ class WaveManager:
         self.wave_config = wave_config
         self.enemy_config = enemy_config
         
+        # Per-type lookup tables, indexed by enemy type id; float64 to match
+        # the health/speed arrays they feed, so config values stay exact
+        self._type_names = list(enemy_config)
+        self._type_index = {name: i for i, name in enumerate(self._type_names)}
+        self._type_health = np.array([enemy_config[n]['health'] for n in self._type_names], dtype=np.float64)
+        self._type_speed = np.array([enemy_config[n]['speed'] for n in self._type_names], dtype=np.float64)
+        self._type_coherence_cost = np.array(
+            [enemy_config[n]['coherence_cost'] for n in self._type_names], dtype=np.float64
+        )
+        
         self.current_wave = -1
         self.enemies: List[EnemySuperposition] = []
+        self._index_of: Dict[int, int] = {}  # enemy_id -> index in self.enemies
+        self._allocate_arrays(INITIAL_ENEMY_CAPACITY)
         self.entangled_pairs: List[EntangledEnemyPair] = []
-        self.spawn_queue = []
+        self._pair_by_id: Dict[int, EntangledEnemyPair] = {}  # enemy_id -> its pair
+        self._pair_index: Dict[int, int] = {}  # id(pair) -> index in self.entangled_pairs
+        self.spawn_queue = deque()
+        self.sim_time = 0.0  # Simulation clock, advanced by delta_time
         self.last_spawn_time = 0
         self.wave_active = False
         self.wave_start_time = 0
@@ -40,9 +74,15 @@ class WaveManager:
     def reset(self):
         """Reset wave manager"""
         self.current_wave = -1
+        for enemy in self.enemies:
+            enemy.detach()
         self.enemies.clear()
+        self._index_of.clear()
         self.entangled_pairs.clear()
+        self._pair_by_id.clear()
+        self._pair_index.clear()
         self.spawn_queue.clear()
+        self.sim_time = 0.0
         self.last_spawn_time = 0
         self.wave_active = False
         logger.info("Wave Manager reset")
@@ -61,33 +101,77 @@ class WaveManager:
         config = self.wave_config[config_index]
         
         # Build spawn queue
-        self.spawn_queue = []
-        for enemy_type, count in config['enemies']:
-            for _ in range(count):
-                self.spawn_queue.append(enemy_type)
+        type_ids = np.array([self._type_index[t] for t, _ in config['enemies']], dtype=np.int8)
+        counts = np.array([c for _, c in config['enemies']], dtype=np.int32)
+        spawn_order = np.repeat(type_ids, counts)
         
         # Shuffle for variety
-        np.random.shuffle(self.spawn_queue)
+        _rng.shuffle(spawn_order)
+        self.spawn_queue = self._prepare_spawns(spawn_order)
         
         self.wave_active = True
-        self.wave_start_time = time.time()
-        self.last_spawn_time = time.time()
+        self.wave_start_time = self.sim_time
+        self.last_spawn_time = self.sim_time
+        
+        logger.info("Wave %d started with %d enemies", wave_number + 1, len(spawn_order))
+    
+    def _prepare_spawns(self, spawn_order: np.ndarray) -> deque:
+        """
+        Decide pairings and build entangled circuits for a wave up front
+        
+        Keeps circuit construction out of the per-frame spawn path; the
+        per-enemy circuits are deferred until first use.
+        
+        Args:
+            spawn_order: Shuffled enemy type ids
+            
+        Returns:
+            Queue of PendingSpawn records
+        """
+        # 30% chance for entangled pair (if another enemy available)
+        pair_rolls = _rng.random(len(spawn_order), dtype=np.float32) < 0.3
         
-        logger.info(f"Wave {wave_number + 1} started with {len(self.spawn_queue)} enemies")
+        pending = deque()
+        health = self._type_health
+        speed = self._type_speed
+        i = 0
+        while i < len(spawn_order):
+            tid = int(spawn_order[i])
+            if pair_rolls[i] and i + 1 < len(spawn_order):
+                tid2 = int(spawn_order[i + 1])
+                
+                # Use average stats for pair
+                pending.append(PendingSpawn(
+                    type_ids=(tid, tid2),
+                    health=float(health[tid] + health[tid2]) / 2,
+                    speed=float(speed[tid] + speed[tid2]) / 2,
+                    entangled_qc=self.spawner.quantum_state_manager.create_entangled_pair()
+                ))
+                i += 2
+            else:
+                pending.append(PendingSpawn(
+                    type_ids=(tid,),
+                    health=float(health[tid]),
+                    speed=float(speed[tid])
+                ))
+                i += 1
+        return pending
     
-    def update(self, delta_time: float, current_time: float) -> int:
+    def update(self, delta_time: float) -> int:
         """
         Update wave state
         
         Args:
             delta_time: Time since last update (seconds)
-            current_time: Current time
             
         Returns:
             0: Wave ongoing
             1: Wave completed
             -1: Enemy reached end (life lost)
         """
+        self.sim_time += delta_time
+        current_time = self.sim_time
+        
         if not self.wave_active:
             return 0
         
@@ -100,24 +184,12 @@ class WaveManager:
             self.last_spawn_time = current_time
         
         # Update all enemies
-        life_lost = False
-        for enemy in self.enemies[:]:
-            enemy.update_position(delta_time)
-            
-            # Check if dead
-            if not enemy.is_alive():
-                self.remove_enemy(enemy)
-                continue
-            
-            # Check if reached end
-            if enemy.is_at_end():
-                self.remove_enemy(enemy)
-                life_lost = True
+        life_lost = self._tick(delta_time)
         
         # Check wave completion
         if not self.spawn_queue and len(self.enemies) == 0:
             self.wave_active = False
-            logger.info(f"Wave {self.current_wave + 1} completed")
+            logger.info("Wave %d completed", self.current_wave + 1)
             return 1
         
         if life_lost:
@@ -125,6 +197,39 @@ class WaveManager:
         
         return 0
     
+    def _tick(self, delta_time: float) -> bool:
+        """
+        Advance all enemies and remove the dead and those at the end
+        
+        Args:
+            delta_time: Time since last update (seconds)
+            
+        Returns:
+            True if any enemy reached the end
+        """
+        n = len(self.enemies)
+        if NUMBA_AVAILABLE:
+            # One fused pass over the arrays
+            n_dead, n_end = tick_enemies(
+                self.progress[:n], self.speed[:n], self.health[:n], delta_time,
+                self._dead_idx, self._end_idx
+            )
+            dead = self._dead_idx[:n_dead]
+            ended = self._end_idx[:n_end]
+        else:
+            progress = self.progress[:n]
+            progress += self.speed[:n] * delta_time
+            alive = self.health[:n] > 0
+            dead = np.flatnonzero(~alive)
+            ended = np.flatnonzero(alive & (progress >= 1.0))
+        
+        if len(dead) or len(ended):
+            # Descending order: every swapped-in last enemy is a survivor
+            for i in sorted(dead.tolist() + ended.tolist(), reverse=True):
+                self.remove_enemy(self.enemies[i])
+        
+        return len(ended) > 0
+    
     def spawn_next_enemy(self, current_time: float):
         """
         Spawn the next enemy from queue
@@ -135,39 +240,75 @@ class WaveManager:
         if not self.spawn_queue:
             return
         
-        enemy_type = self.spawn_queue.pop(0)
-        config = self.enemy_config[enemy_type]
+        spawn = self.spawn_queue.popleft()
         
-        # 30% chance for entangled pair (if another enemy available)
-        if np.random.random() < 0.3 and len(self.spawn_queue) > 0:
+        if len(spawn.type_ids) == 2:
             # Spawn entangled pair
-            enemy_type2 = self.spawn_queue.pop(0)
-            config2 = self.enemy_config[enemy_type2]
-            
-            # Use average stats for pair
-            avg_health = (config['health'] + config2['health']) / 2
-            avg_speed = (config['speed'] + config2['speed']) / 2
-            
             pair = self.spawner.spawn_entangled_pair(
-                health=avg_health,
-                speed=avg_speed,
-                current_time=current_time
+                health=spawn.health,
+                speed=spawn.speed,
+                current_time=current_time,
+                entangled_qc=spawn.entangled_qc
             )
             
-            self.entangled_pairs.append(pair)
-            self.enemies.extend([pair.enemy1, pair.enemy2])
+            self._add_pair(pair)
+            self._add_enemy(pair.enemy1, spawn.type_ids[0])
+            self._add_enemy(pair.enemy2, spawn.type_ids[1])
             
-            logger.debug(f"Spawned entangled pair: {enemy_type} + {enemy_type2}")
+            names = self._type_names
+            logger.debug("Spawned entangled pair: %s + %s", names[spawn.type_ids[0]], names[spawn.type_ids[1]])
         else:
             # Spawn single enemy
             enemy = self.spawner.spawn_single_enemy(
-                health=config['health'],
-                speed=config['speed'],
+                health=spawn.health,
+                speed=spawn.speed,
                 current_time=current_time
             )
-            self.enemies.append(enemy)
+            self._add_enemy(enemy, spawn.type_ids[0])
             
-            logger.debug(f"Spawned {enemy_type} enemy (ID: {enemy.enemy_id})")
+            logger.debug("Spawned %s enemy (ID: %d)", self._type_names[spawn.type_ids[0]], enemy.enemy_id)
+    
+    def _allocate_arrays(self, capacity: int):
+        """Allocate empty per-enemy arrays"""
+        self.progress = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.health = np.zeros(capacity, dtype=np.float64)
+        self.is_measured = np.zeros(capacity, dtype=np.bool_)
+        self.measured_path = np.full(capacity, -1, dtype=np.int8)  # -1 = unmeasured
+        self.type_id = np.zeros(capacity, dtype=np.int16)
+        self._allocate_scratch(capacity)
+    
+    def _allocate_scratch(self, capacity: int):
+        """Allocate per-frame scratch buffers (contents never persist)"""
+        self._range_mask = np.zeros(capacity, dtype=np.bool_)  # get_enemies_in_range
+        self._dead_idx = np.zeros(capacity, dtype=np.int64)  # _tick dead enemies
+        self._end_idx = np.zeros(capacity, dtype=np.int64)  # _tick enemies at the end
+    
+    def _grow_arrays(self):
+        """Double capacity of the per-enemy arrays"""
+        for name in _ENEMY_ARRAYS:
+            old = getattr(self, name)
+            new = np.empty(2 * len(old), dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self._allocate_scratch(len(self.progress))
+    
+    def _add_enemy(self, enemy: EnemySuperposition, type_id: int):
+        """Append enemy, record its index and move its state into the arrays"""
+        idx = len(self.enemies)
+        if idx == len(self.progress):
+            self._grow_arrays()
+        self._index_of[enemy.enemy_id] = idx
+        self.enemies.append(enemy)
+        enemy.attach(self, idx)
+        self.type_id[idx] = type_id
+    
+    def _add_pair(self, pair: EntangledEnemyPair):
+        """Append entangled pair and index it by both member IDs"""
+        self._pair_index[id(pair)] = len(self.entangled_pairs)
+        self.entangled_pairs.append(pair)
+        self._pair_by_id[pair.enemy1.enemy_id] = pair
+        self._pair_by_id[pair.enemy2.enemy_id] = pair
     
     def remove_enemy(self, enemy: EnemySuperposition):
         """
@@ -176,19 +317,36 @@ class WaveManager:
         Args:
             enemy: Enemy to remove
         """
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
+        idx = self._index_of.pop(enemy.enemy_id, None)
+        if idx is not None:
+            # Keep state readable by anyone still holding the enemy
+            enemy.detach()
+            
+            # Swap-pop: move last enemy (and its array row) into the freed slot
+            last = self.enemies.pop()
+            n = len(self.enemies)
+            if idx < n:
+                for name in _ENEMY_ARRAYS:
+                    arr = getattr(self, name)
+                    arr[idx] = arr[n]
+                self.enemies[idx] = last
+                self._index_of[last.enemy_id] = idx
+                last._index = idx
         
         # Remove from entangled pairs if applicable
-        if enemy.is_entangled:
-            for pair in self.entangled_pairs[:]:
-                if pair.enemy1 == enemy or pair.enemy2 == enemy:
-                    self.entangled_pairs.remove(pair)
-                    
-                    # Mark partner as no longer entangled
-                    partner = pair.enemy2 if pair.enemy1 == enemy else pair.enemy1
-                    partner.is_entangled = False
-                    partner.entangled_partner_id = None
+        pair = self._pair_by_id.pop(enemy.enemy_id, None)
+        if pair is not None:
+            # Mark partner as no longer entangled
+            partner = pair.enemy2 if pair.enemy1 is enemy else pair.enemy1
+            self._pair_by_id.pop(partner.enemy_id, None)
+            partner.is_entangled = False
+            partner.entangled_partner_id = None
+            
+            idx = self._pair_index.pop(id(pair))
+            last = self.entangled_pairs.pop()
+            if idx < len(self.entangled_pairs):
+                self.entangled_pairs[idx] = last
+                self._pair_index[id(last)] = idx
     
     def get_wave_multiplier(self) -> float:
         """
@@ -213,22 +371,9 @@ class WaveManager:
         Returns:
             Total coherence drain
         """
-        total_drain = 0.0
-        
-        for enemy in self.enemies:
-            if not enemy.is_measured:
-                # Get enemy type from health (approximate)
-                coherence_cost = 0.5  # Default basic enemy
-                if enemy.health >= 900:
-                    coherence_cost = 1.0  # Boss
-                elif enemy.health >= 250:
-                    coherence_cost = 0.8  # Tank
-                elif enemy.health <= 60:
-                    coherence_cost = 0.3  # Fast
-                
-                total_drain += coherence_cost * delta_time
-        
-        return total_drain
+        n = len(self.enemies)
+        coherence_cost = self._type_coherence_cost[self.type_id[:n]]
+        return float(delta_time * coherence_cost[~self.is_measured[:n]].sum())
     
     def get_enemy_by_id(self, enemy_id: int) -> EnemySuperposition:
         """
@@ -240,10 +385,33 @@ class WaveManager:
         Returns:
             Enemy object or None
         """
-        for enemy in self.enemies:
-            if enemy.enemy_id == enemy_id:
-                return enemy
-        return None
+        idx = self._index_of.get(enemy_id)
+        return self.enemies[idx] if idx is not None else None
+    
+    def compute_enemy_positions(self) -> np.ndarray:
+        """
+        Get candidate positions of every enemy on each path it may occupy
+        
+        Returns:
+            float32 array of shape (N, NUM_PATHS, 2), rows aligned with
+            self.enemies; measured enemies repeat their collapsed position
+        """
+        n = len(self.enemies)
+        paths = np.tile(np.arange(NUM_PATHS, dtype=np.intp), (n, 1))
+        measured = self.is_measured[:n]
+        paths[measured] = self.measured_path[:n][measured, None]
+        
+        xy = get_positions_from_lut(paths.ravel(), np.repeat(self.progress[:n], NUM_PATHS))
+        return xy.reshape(n, NUM_PATHS, 2)
+    
+    def compute_alive_mask(self) -> np.ndarray:
+        """
+        Get which enemies are still alive, straight from the health array
+        
+        Returns:
+            Boolean array of shape (N,), aligned with self.enemies
+        """
+        return self.health[:len(self.enemies)] > 0
     
     def get_enemies_in_range(self, position: tuple, range_dist: float) -> List[EnemySuperposition]:
         """
@@ -256,27 +424,12 @@ class WaveManager:
         Returns:
             List of enemies in range
         """
-        from config.game_config import get_position_on_path
-        
-        in_range = []
-        for enemy in self.enemies:
-            # Check all possible paths for unmeasured enemies
-            if enemy.is_measured:
-                pos = get_position_on_path(enemy.measured_path, enemy.position_progress)
-                distance = np.sqrt(
-                    (pos[0] - position[0])**2 + (pos[1] - position[1])**2
-                )
-                if distance <= range_dist:
-                    in_range.append(enemy)
-            else:
-                # Check each path with probability
-                for path_idx in range(4):
-                    pos = get_position_on_path(path_idx, enemy.position_progress)
-                    distance = np.sqrt(
-                        (pos[0] - position[0])**2 + (pos[1] - position[1])**2
-                    )
-                    if distance <= range_dist:
-                        in_range.append(enemy)
-                        break  # Only add once
-        
-        return in_range
+        n = len(self.enemies)
+        mask = self._range_mask[:n]
+        enemies_in_range_kernel(
+            self.progress[:n], self.is_measured[:n], self.measured_path[:n],
+            float(position[0]), float(position[1]), float(range_dist) ** 2,
+            PATH_LUT, mask
+        )
+        enemies = self.enemies
+        return [enemies[i] for i in np.flatnonzero(mask).tolist()]
@@ -6,6 +6,7 @@ Quantum Tower Defense - IBM Qiskit Educational Game
 import pygame
 import sys
 import logging
+from collections import deque
 from pathlib import Path
 
 # Import game modules
@@ -72,10 +73,14 @@ class QuantumTowerDefense:
         self.mouse_pos = (0, 0)
         self.show_tutorial = True
         self.selected_tower_for_removal = None
+        self._static_dirty = True  # Static screen needs redrawing
+        self._refund_font = pygame.font.Font(None, 20)
+        self._refund_texts = {}  # Refund label surfaces keyed by amount
         
         # Performance tracking
         self.frame_count = 0
-        self.fps_history = []
+        self.fps_history = deque(maxlen=60)
+        self._fps_sum = 0.0  # Running sum of fps_history
         logger.info("Game initialized successfully")
 
     def run(self):
@@ -89,9 +94,10 @@ class QuantumTowerDefense:
 
             # Track FPS
             current_fps = self.clock.get_fps()
+            if len(self.fps_history) == self.fps_history.maxlen:
+                self._fps_sum -= self.fps_history[0]
             self.fps_history.append(current_fps)
-            if len(self.fps_history) > 60:
-                self.fps_history.pop(0)
+            self._fps_sum += current_fps
 
             # Handle events
             running = self.handle_events()
@@ -100,11 +106,14 @@ class QuantumTowerDefense:
             if self.game_state == "playing":
                 self.update(delta_time)
 
-            # Render
-            self.render()
+            # Static screens (menu, pause, game over, victory) are only
+            # redrawn after an event; otherwise the last frame stays up
+            if self.game_state == "playing" or self._static_dirty:
+                self.render()
 
-            # Update display
-            pygame.display.flip()
+                # Update display
+                pygame.display.flip()
+                self._static_dirty = self.game_state == "playing"
 
         logger.info("Game loop ended")
         self.cleanup()
@@ -113,6 +122,8 @@ class QuantumTowerDefense:
         """Handle all input events"""
         self.mouse_pos = pygame.mouse.get_pos()
         for event in pygame.event.get():
+            # Any input (or window exposure) may change a static screen
+            self._static_dirty = True
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -239,10 +250,9 @@ class QuantumTowerDefense:
 
     def update(self, delta_time):
         """Update game state"""
-        import time
-        current_time = time.time()
-        # Update wave manager
-        result = self.wave_manager.update(delta_time, current_time)
+        # Update wave manager; its simulation clock drives the towers too
+        result = self.wave_manager.update(delta_time)
+        current_time = self.wave_manager.sim_time
         if result == -1:  # Enemy reached end
             self.resource_manager.lose_life()
             logger.info(f"Life lost! Lives remaining: {self.resource_manager.lives}")
@@ -257,12 +267,16 @@ class QuantumTowerDefense:
             if self.resource_manager.wave > len(WAVE_CONFIG):
                 self.game_state = "victory"
                 logger.info("Victory! All waves completed!")
+        # Collapse measured enemies before their positions are resolved
+        self.tower_manager.apply_measurements(self.effects_manager)
         # Update towers (including attack/visuals)
         self.tower_manager.update_all_towers(
             self.wave_manager.enemies,
             self.wave_manager.entangled_pairs,
             current_time,
-            self.effects_manager
+            self.effects_manager,
+            self.wave_manager.compute_enemy_positions(),
+            self.wave_manager.compute_alive_mask()
         )
         # Update resources
         self.resource_manager.regenerate_coherence(delta_time)
@@ -306,7 +320,7 @@ class QuantumTowerDefense:
                 self.resource_manager,
                 self.selected_tower_type,
                 self.wave_manager.wave_active,
-                sum(self.fps_history) / len(self.fps_history) if self.fps_history else 60
+                self._fps_sum / len(self.fps_history) if self.fps_history else 60
             )
             # Render tutorial
             if self.show_tutorial:
@@ -343,8 +357,10 @@ class QuantumTowerDefense:
         )
         tower_cost = TOWER_CONFIG[tower.tower_type]['cost']
         refund = tower_cost // 2
-        font = pygame.font.Font(None, 20)
-        text = font.render(f"Refund: ${refund}", True, (255, 255, 100))
+        text = self._refund_texts.get(refund)
+        if text is None:
+            text = self._refund_font.render(f"Refund: ${refund}", True, (255, 255, 100)).convert_alpha()
+            self._refund_texts[refund] = text
         self.screen.blit(text, (tower.position[0] - 40, tower.position[1] - 50))
 
     def handle_right_click(self, pos):
@@ -354,8 +370,9 @@ class QuantumTowerDefense:
             return
         # Find tower at click position
         for tower in self.tower_manager.towers:
-            distance = ((tower.position[0] - pos[0]) ** 2 + (tower.position[1] - pos[1]) ** 2) ** 0.5
-            if distance <= 30:
+            dx = tower.position[0] - pos[0]
+            dy = tower.position[1] - pos[1]
+            if dx * dx + dy * dy <= 30 * 30:
                 if self.selected_tower_for_removal == tower:
                     self.selected_tower_for_removal = None
                 else:
@@ -368,6 +385,7 @@ class QuantumTowerDefense:
     def cleanup(self):
         """Cleanup resources"""
         logger.info("Cleaning up resources...")
+        self.tower_manager.shutdown()
         pygame.quit()
         logger.info("Quantum Tower Defense shut down successfully")
 
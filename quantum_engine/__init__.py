@@ -5,10 +5,12 @@ Contains quantum state management and enemy superposition mechanics
 
 from .quantum_state import QuantumStateManager
 from .enemy_superposition import EnemySuperposition, EnemySpawner, EntangledEnemyPair
+from .quantum_worker import QuantumWorker
 
 __all__ = [
     'QuantumStateManager',
     'EnemySuperposition',
     'EnemySpawner',
-    'EntangledEnemyPair'
+    'EntangledEnemyPair',
+    'QuantumWorker'
 ]
@@ -2,31 +2,89 @@
 Enemy Superposition - Handles quantum enemy states and behaviors
 """
 
-from dataclasses import dataclass
 from typing import Optional, List, Tuple
 import numpy as np
 from qiskit import QuantumCircuit
 
 
-@dataclass
+class _StoredField:
+    """
+    Attribute backed by a row of a structure-of-arrays store
+    
+    Reads and writes go to store.<array>[index] while the enemy is attached
+    to a store, and to a plain instance attribute otherwise.
+    """
+    
+    def __init__(self, array: str, decode=float, encode=None):
+        self.array = array
+        self.decode = decode
+        self.encode = encode
+    
+    def __set_name__(self, owner, name):
+        self.local = '_' + name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return getattr(obj, self.local)
+        return self.decode(getattr(store, self.array)[obj._index])
+    
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            setattr(obj, self.local, value)
+        else:
+            getattr(store, self.array)[obj._index] = value if self.encode is None else self.encode(value)
+
+
+def _decode_path(value) -> Optional[int]:
+    """Stored path index (-1 = unmeasured) to Optional[int]"""
+    return None if value < 0 else int(value)
+
+
+def _encode_path(value: Optional[int]) -> int:
+    """Optional[int] path index to stored value (-1 = unmeasured)"""
+    return -1 if value is None else value
+
+
 class EnemySuperposition:
     """Represents an enemy in quantum superposition"""
     
-    enemy_id: int
-    quantum_circuit: QuantumCircuit
-    health: float
-    speed: float
-    position_progress: float  # 0.0 to 1.0 along path
-    is_measured: bool
-    measured_path: Optional[int]
-    is_entangled: bool
-    entangled_partner_id: Optional[int]
-    spawn_time: float
-    
-    def __init__(self, enemy_id: int, qc: QuantumCircuit, health: float = 100.0, 
-                 speed: float = 1.0, spawn_time: float = 0.0):
+    __slots__ = (
+        'enemy_id', 'is_entangled', 'entangled_partner_id', 'spawn_time',
+        '_health', '_speed', '_position_progress', '_is_measured', '_measured_path',
+        '_store', '_index', '_qc', '_qc_shared', '_qc_spec', '_qsm',
+    )
+    
+    # Hot per-frame state; lives in the wave manager's arrays once spawned
+    health = _StoredField('health')
+    speed = _StoredField('speed')
+    position_progress = _StoredField('progress')  # 0.0 to 1.0 along path
+    is_measured = _StoredField('is_measured', bool)
+    measured_path = _StoredField('measured_path', _decode_path, _encode_path)
+    
+    def __init__(self, enemy_id: int, qc: Optional[QuantumCircuit], health: float = 100.0, 
+                 speed: float = 1.0, spawn_time: float = 0.0,
+                 path_probabilities: Optional[List[float]] = None, quantum_state_manager=None):
+        """
+        Args:
+            enemy_id: Unique enemy ID
+            qc: Quantum circuit, or None to build it on first access
+            health: Enemy health
+            speed: Enemy speed
+            spawn_time: Spawn time
+            path_probabilities: Superposition spec for a deferred circuit
+            quantum_state_manager: Builds the deferred circuit
+        """
         self.enemy_id = enemy_id
-        self.quantum_circuit = qc
+        self._store = None  # Owning store, or None while detached
+        self._index = -1  # Row in the store's arrays
+        self._qc = qc
+        self._qc_shared = False  # True while _qc is the manager's shared template
+        self._qc_spec = path_probabilities
+        self._qsm = quantum_state_manager
         self.health = health
         self.speed = speed
         self.position_progress = 0.0
@@ -36,6 +94,59 @@ class EnemySuperposition:
         self.entangled_partner_id = None
         self.spawn_time = spawn_time
     
+    @property
+    def quantum_circuit(self) -> QuantumCircuit:
+        """
+        Quantum circuit, resolved from the superposition spec on first access
+        
+        Until the enemy's state is modified this is a shared template; use
+        writable_circuit() before applying gates.
+        """
+        if self._qc is None:
+            if self._qsm is None:
+                raise RuntimeError(
+                    f"Enemy {self.enemy_id} has no circuit and no quantum state manager to build one"
+                )
+            self._qc = self._qsm.get_superposition_template(self._qc_spec)
+            self._qc_shared = True
+        return self._qc
+    
+    @quantum_circuit.setter
+    def quantum_circuit(self, qc: QuantumCircuit):
+        self._qc = qc
+        self._qc_shared = False
+    
+    def writable_circuit(self) -> QuantumCircuit:
+        """Get a circuit owned by this enemy, copying the shared template on first write"""
+        qc = self.quantum_circuit
+        if self._qc_shared:
+            qc = qc.copy()
+            self.quantum_circuit = qc
+        return qc
+    
+    def attach(self, store, index: int):
+        """
+        Move hot state into row `index` of a structure-of-arrays store
+        
+        Args:
+            store: Object exposing health, speed, progress, is_measured
+                   and measured_path arrays
+            index: Row to occupy
+        """
+        values = (self.health, self.speed, self.position_progress, self.is_measured, self.measured_path)
+        self._store = store
+        self._index = index
+        (self.health, self.speed, self.position_progress,
+         self.is_measured, self.measured_path) = values
+    
+    def detach(self):
+        """Copy hot state back out of the store"""
+        values = (self.health, self.speed, self.position_progress, self.is_measured, self.measured_path)
+        self._store = None
+        self._index = -1
+        (self.health, self.speed, self.position_progress,
+         self.is_measured, self.measured_path) = values
+    
     def update_position(self, delta_time: float):
         """Update enemy position along path"""
         self.position_progress += self.speed * delta_time
@@ -77,13 +188,27 @@ class EnemySuperposition:
         if self.is_measured:
             return [(self.measured_path, 1.0)]
         
-        probabilities = quantum_state_manager.get_path_probabilities(self.quantum_circuit)
+        if self._qc is None or self._qc_shared:
+            # No gates applied yet, so the state is still exactly the spec
+            probabilities = self._spec_probabilities(quantum_state_manager.num_paths)
+        else:
+            probabilities = quantum_state_manager.get_path_probabilities(self._qc)
         return [(i, p) for i, p in enumerate(probabilities) if p > 0.01]
+    
+    def _spec_probabilities(self, num_paths: int) -> np.ndarray:
+        """Path probabilities of the unbuilt superposition spec"""
+        if self._qc_spec is None:
+            return np.full(num_paths, 1.0 / num_paths)
+        probabilities = np.asarray(self._qc_spec, dtype=np.float64)
+        probabilities = probabilities / probabilities.sum()
+        return np.pad(probabilities, (0, num_paths - len(probabilities)))
 
 
 class EntangledEnemyPair:
     """Manages a pair of entangled enemies"""
     
+    __slots__ = ('enemy1', 'enemy2', 'entangled_circuit', 'num_qubits_per_enemy')
+    
     def __init__(self, enemy1: EnemySuperposition, enemy2: EnemySuperposition, 
                  entangled_qc: QuantumCircuit, num_qubits_per_enemy: int):
         self.enemy1 = enemy1
@@ -152,6 +277,8 @@ class EnemySpawner:
         """
         Spawn a single enemy in superposition
         
+        The circuit is built lazily, on first access to quantum_circuit.
+        
         Args:
             health: Enemy health
             speed: Enemy speed
@@ -161,19 +288,21 @@ class EnemySpawner:
         Returns:
             EnemySuperposition object
         """
-        qc = self.quantum_state_manager.create_superposition_state(path_probabilities)
         enemy = EnemySuperposition(
             enemy_id=self.next_enemy_id,
-            qc=qc,
+            qc=None,
             health=health,
             speed=speed,
-            spawn_time=current_time
+            spawn_time=current_time,
+            path_probabilities=path_probabilities,
+            quantum_state_manager=self.quantum_state_manager
         )
         self.next_enemy_id += 1
         return enemy
     
     def spawn_entangled_pair(self, health: float = 100.0, speed: float = 1.0,
-                            current_time: float = 0.0) -> EntangledEnemyPair:
+                            current_time: float = 0.0,
+                            entangled_qc: Optional[QuantumCircuit] = None) -> EntangledEnemyPair:
         """
         Spawn an entangled pair of enemies
         
@@ -181,22 +310,24 @@ class EnemySpawner:
             health: Enemy health for each
             speed: Enemy speed for each
             current_time: Current game time
+            entangled_qc: Prebuilt entangled circuit (None to build now)
             
         Returns:
             EntangledEnemyPair object
         """
         # Create entangled quantum circuit
-        entangled_qc = self.quantum_state_manager.create_entangled_pair()
+        if entangled_qc is None:
+            entangled_qc = self.quantum_state_manager.create_entangled_pair()
         num_qubits = self.quantum_state_manager.num_qubits
         
-        # Create individual quantum circuits for each enemy (will be synced)
-        qc1 = self.quantum_state_manager.create_superposition_state()
-        qc2 = self.quantum_state_manager.create_superposition_state()
-        
-        enemy1 = EnemySuperposition(self.next_enemy_id, qc1, health, speed, current_time)
+        # Individual circuits for each enemy (will be synced) are built lazily
+        qsm = self.quantum_state_manager
+        enemy1 = EnemySuperposition(self.next_enemy_id, None, health, speed, current_time,
+                                    quantum_state_manager=qsm)
         self.next_enemy_id += 1
         
-        enemy2 = EnemySuperposition(self.next_enemy_id, qc2, health, speed, current_time + 0.5)
+        enemy2 = EnemySuperposition(self.next_enemy_id, None, health, speed, current_time + 0.5,
+                                    quantum_state_manager=qsm)
         self.next_enemy_id += 1
         
         pair = EntangledEnemyPair(enemy1, enemy2, entangled_qc, num_qubits)
@@ -3,11 +3,104 @@ Quantum State Manager for Tower Defense
 Handles qubit representation of enemies and quantum operations
 """
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit import QuantumCircuit, QuantumRegister, transpile
 from qiskit_aer import AerSimulator
 from qiskit.quantum_info import Statevector
+import cmath
+import math
 import numpy as np
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional
+
+PROB_CACHE_SIZE = 128  # Circuits whose path probabilities are remembered
+SMALL_SIM_MAX_QUBITS = 4  # Circuits up to this size skip Qiskit's Statevector
+STATE_DTYPE = np.complex64  # Plenty of precision for path probabilities
+
+_rng = np.random.default_rng()
+_SQRT1_2 = 1.0 / math.sqrt(2.0)
+
+
+def _simulate_small(qc: QuantumCircuit) -> Optional[np.ndarray]:
+    """
+    Simulate a small circuit with plain NumPy index arithmetic
+    
+    Handles the gates the game builds (h, x, cx, p, cp, mcphase, a full
+    initialize, any single-qubit gate with a matrix, and custom gates
+    through their definitions). Qubit 0 is the least significant bit of
+    the state index, as in Qiskit.
+    
+    Args:
+        qc: Quantum circuit without measurements
+    
+    Returns:
+        Final statevector, or None if the circuit uses anything unsupported
+    """
+    n = qc.num_qubits
+    if n > SMALL_SIM_MAX_QUBITS:
+        return None
+    
+    idx = np.arange(1 << n)
+    state = np.zeros(1 << n, dtype=STATE_DTYPE)
+    state[0] = 1.0
+    
+    return _apply_small(state, idx, qc, list(range(n)))
+
+
+def _apply_small(state: np.ndarray, idx: np.ndarray, qc: QuantumCircuit,
+                 qubit_map: List[int]) -> Optional[np.ndarray]:
+    """
+    Apply qc's instructions to state for _simulate_small
+    
+    Args:
+        state: Statevector over the full register
+        idx: Basis state indices, np.arange(len(state))
+        qc: Circuit (or gate definition) to apply
+        qubit_map: Full-register qubit for each of qc's qubits
+    
+    Returns:
+        Updated statevector, or None if an instruction is unsupported
+    """
+    for instr in qc.data:
+        op = instr.operation
+        name = op.name
+        qubits = [qubit_map[qc.find_bit(q).index] for q in instr.qubits]
+        
+        if name == 'barrier':
+            continue
+        if name == 'h':
+            bit = 1 << qubits[0]
+            partner = state[idx ^ bit]
+            state = np.where(idx & bit, partner - state, state + partner) * _SQRT1_2
+        elif name == 'x':
+            state = state[idx ^ (1 << qubits[0])]
+        elif name == 'cx':
+            control, target = qubits
+            state = state[idx ^ (((idx >> control) & 1) << target)]
+        elif name in ('p', 'cp', 'mcphase'):
+            # Diagonal: phase applies where every involved qubit is 1
+            mask = sum(1 << q for q in qubits)
+            state[(idx & mask) == mask] *= cmath.exp(1j * float(op.params[0]))
+        elif name == 'initialize':
+            if qubits != list(range(len(idx).bit_length() - 1)) or isinstance(op.params[0], str):
+                return None
+            state = np.asarray(op.params, dtype=STATE_DTYPE)
+            if state.shape != idx.shape:
+                return None
+        elif len(qubits) == 1 and hasattr(op, '__array__'):
+            u = op.to_matrix().astype(STATE_DTYPE)
+            bit = 1 << qubits[0]
+            partner = state[idx ^ bit]
+            state = np.where(idx & bit,
+                             u[1, 0] * partner + u[1, 1] * state,
+                             u[0, 0] * state + u[0, 1] * partner)
+        elif getattr(op, 'definition', None) is not None:
+            state = _apply_small(state, idx, op.definition, qubits)
+            if state is None:
+                return None
+        else:
+            return None
+    
+    return state
 
 
 class QuantumStateManager:
@@ -22,7 +115,11 @@ class QuantumStateManager:
         """
         self.num_paths = num_paths
         self.num_qubits = int(np.log2(num_paths))
-        self.simulator = AerSimulator()
+        self.simulator = AerSimulator(method='statevector')
+        self._sup_cache: Dict[Optional[tuple], QuantumCircuit] = {}  # Shared superposition templates
+        self._prob_cache: OrderedDict = OrderedDict()  # circuit key -> path probabilities (LRU)
+        self._bell_template: Optional[QuantumCircuit] = None  # Compiled entangled pair
+        self._phase_oracle_cache: Dict[tuple, QuantumCircuit] = {}  # (num_qubits, path, phase) -> oracle
         
     def create_superposition_state(self, probabilities: Optional[List[float]] = None) -> QuantumCircuit:
         """
@@ -55,38 +152,89 @@ class QuantumStateManager:
         
         return qc
     
+    def get_superposition_template(self, probabilities: Optional[List[float]] = None) -> QuantumCircuit:
+        """
+        Get a shared superposition circuit, built once per probability spec
+        
+        The circuit is shared between callers and must not be modified;
+        copy it before applying gates.
+        
+        Args:
+            probabilities: Optional probability amplitudes for each path
+        
+        Returns:
+            Shared QuantumCircuit for the superposition state
+        """
+        key = tuple(probabilities) if probabilities is not None else None
+        qc = self._sup_cache.get(key)
+        if qc is None:
+            qc = self.create_superposition_state(probabilities)
+            self._sup_cache[key] = qc
+        return qc
+    
+    def _statevector(self, qc: QuantumCircuit) -> np.ndarray:
+        """Final statevector of qc, from the NumPy simulator when it applies"""
+        state = _simulate_small(qc)
+        if state is None:
+            state = Statevector(qc).data.astype(STATE_DTYPE, copy=False)
+        return state
+    
     def apply_phase_gate(self, qc: QuantumCircuit, path_index: int, phase: float) -> QuantumCircuit:
         """
         Apply phase rotation to specific path (used for tower effects)
         
+        The oracle is built once per (path_index, phase) from standard
+        gates and composed into qc in place, so Aer runs it without
+        transpiling.
+        
         Args:
             qc: Quantum circuit
             path_index: Index of path to apply phase to
             phase: Phase angle in radians
         
         Returns:
-            Modified quantum circuit
+            The same quantum circuit, modified in place
         """
-        # Convert path index to binary string for controlled phase
-        binary = format(path_index, f'0{self.num_qubits}b')
+        key = (self.num_qubits, path_index, round(phase, 6))
+        oracle = self._phase_oracle_cache.get(key)
+        if oracle is None:
+            oracle = self._build_phase_oracle(path_index, phase)
+            self._phase_oracle_cache[key] = oracle
+        
+        qc.compose(oracle, range(self.num_qubits), inplace=True)
+        return qc
+    
+    def _build_phase_oracle(self, path_index: int, phase: float) -> QuantumCircuit:
+        """
+        Build the phase oracle for one path
+        
+        Args:
+            path_index: Index of path to apply phase to
+            phase: Phase angle in radians
+        
+        Returns:
+            Circuit of x/mcp/x gates marking path_index with the given phase
+        """
+        oracle = QuantumCircuit(self.num_qubits)
+        
+        # Qubits whose bit in path_index is 0 get flipped around the controlled phase
+        flip = [i for i in range(self.num_qubits) if not (path_index >> i) & 1]
         
         # Apply X gates to set up controlled phase
-        for i, bit in enumerate(reversed(binary)):
-            if bit == '0':
-                qc.x(i)
+        for i in flip:
+            oracle.x(i)
         
         # Apply controlled phase
         if self.num_qubits == 1:
-            qc.p(phase, 0)
+            oracle.p(phase, 0)
         else:
-            qc.mcp(phase, list(range(self.num_qubits - 1)), self.num_qubits - 1)
+            oracle.mcp(phase, list(range(self.num_qubits - 1)), self.num_qubits - 1)
         
         # Undo X gates
-        for i, bit in enumerate(reversed(binary)):
-            if bit == '0':
-                qc.x(i)
+        for i in flip:
+            oracle.x(i)
         
-        return qc
+        return oracle
     
     def get_path_probabilities(self, qc: QuantumCircuit) -> np.ndarray:
         """
@@ -96,11 +244,32 @@ class QuantumStateManager:
             qc: Quantum circuit
         
         Returns:
-            Array of probabilities for each path
+            Array of probabilities for each path (read-only, may be shared)
         """
-        statevector = Statevector(qc)
-        probabilities = statevector.probabilities()
-        return probabilities[:self.num_paths]
+        key = self._circuit_key(qc)
+        probabilities = self._prob_cache.get(key)
+        if probabilities is not None:
+            self._prob_cache.move_to_end(key)
+            return probabilities
+        
+        state = self._statevector(qc)
+        probabilities = (state.real ** 2 + state.imag ** 2)[:self.num_paths]
+        probabilities.setflags(write=False)
+        
+        self._prob_cache[key] = probabilities
+        if len(self._prob_cache) > PROB_CACHE_SIZE:
+            self._prob_cache.popitem(last=False)
+        return probabilities
+    
+    @staticmethod
+    def _circuit_key(qc: QuantumCircuit) -> tuple:
+        """Hashable description of a circuit's instructions; any added gate changes it"""
+        return tuple(
+            (instr.operation.name,
+             tuple(qc.find_bit(q).index for q in instr.qubits),
+             tuple(instr.operation.params))
+            for instr in qc.data
+        )
     
     def measure_path(self, qc: QuantumCircuit, shots: int = 1) -> int:
         """
@@ -113,23 +282,59 @@ class QuantumStateManager:
         Returns:
             Measured path index
         """
-        # Add classical register for measurement
-        cr = ClassicalRegister(self.num_qubits)
-        measured_qc = qc.copy()
-        measured_qc.add_register(cr)
-        measured_qc.measure(range(self.num_qubits), range(self.num_qubits))
+        # Sample the path register's distribution directly; no simulator job
+        if qc.num_qubits == self.num_qubits:
+            probabilities = self.get_path_probabilities(qc)
+        else:
+            # Marginal over the path qubits, the low bits of the state index
+            state = self._statevector(qc)
+            probabilities = (state.real ** 2 + state.imag ** 2).reshape(-1, self.num_paths).sum(axis=0)
+        probabilities = probabilities / probabilities.sum(dtype=np.float64)
         
-        # Execute measurement
-        job = self.simulator.run(measured_qc, shots=shots)
-        result = job.result()
-        counts = result.get_counts()
+        samples = _rng.choice(len(probabilities), size=shots, p=probabilities)
         
         # Get most common result (for shots=1, this is the only result)
-        measured_state = max(counts, key=counts.get)
-        path_index = int(measured_state, 2)
+        path_index = int(np.bincount(samples).argmax())
         
         return path_index
     
+    def batch_measure(self, circuits: List[QuantumCircuit], shots: int = 1,
+                      rng: Optional[np.random.Generator] = None) -> List[int]:
+        """
+        Measure several quantum states with a single simulator call
+        
+        Args:
+            circuits: Quantum circuits to measure
+            shots: Number of measurements per circuit
+            rng: Random generator for sampling; callers on another thread
+                 must pass their own, since Generators are not thread-safe
+        
+        Returns:
+            Measured path index for each circuit
+        """
+        if not circuits:
+            return []
+        if rng is None:
+            rng = _rng
+        
+        # Save the path register's distribution instead of measuring it
+        path_qubits = range(self.num_qubits)
+        prob_circuits = []
+        for qc in circuits:
+            prob_qc = qc.copy()
+            prob_qc.save_probabilities(path_qubits)
+            prob_circuits.append(prob_qc)
+        
+        # One job for all circuits instead of one per circuit
+        result = self.simulator.run(prob_circuits, shots=1).result()
+        
+        paths = []
+        for i in range(len(prob_circuits)):
+            probabilities = np.asarray(result.data(i)['probabilities'], dtype=float)
+            samples = rng.choice(len(probabilities), size=shots, p=probabilities / probabilities.sum())
+            paths.append(int(np.bincount(samples).argmax()))
+        return paths
+    
     def calculate_quantum_coherence(self, qc: QuantumCircuit) -> float:
         """
         Calculate coherence measure (resource cost)
@@ -141,14 +346,16 @@ class QuantumStateManager:
         Returns:
             Coherence value (0 to 1, higher = more superposition)
         """
-        statevector = Statevector(qc)
-        density_matrix = statevector.to_operator()
+        sv = self._statevector(qc)
         
-        # Calculate purity: Tr(ρ²)
-        purity = np.real(np.trace(density_matrix.data @ density_matrix.data))
+        # Calculate purity: Tr(ρ²) = <ψ|ψ>² for a pure state ρ = |ψ><ψ|
+        # Accumulate in float64: complex64 rounding would push purity above 1
+        sv = sv.astype(np.complex128, copy=False)
+        norm_sq = float(np.vdot(sv, sv).real)
+        purity = norm_sq * norm_sq
         
         # Coherence is inverse of purity (pure state = low coherence cost)
-        coherence = 1.0 - purity
+        coherence = max(0.0, 1.0 - purity)
         
         return coherence
     
@@ -156,20 +363,24 @@ class QuantumStateManager:
         """
         Create two entangled enemy states (Bell state)
         
+        The pair is parameter-free, so it is built and transpiled once;
+        each call returns a copy of the compiled circuit.
+        
         Returns:
             QuantumCircuit with entangled pair
         """
-        qc = QuantumCircuit(self.num_qubits * 2)
-        
-        # Create equal superposition on first enemy
-        for i in range(self.num_qubits):
-            qc.h(i)
-        
-        # Entangle with second enemy using CNOT gates
-        for i in range(self.num_qubits):
-            qc.cx(i, self.num_qubits + i)
+        if self._bell_template is None:
+            qc = QuantumCircuit(self.num_qubits * 2)
+            
+            # Equal superposition on first enemy
+            qc.h(range(self.num_qubits))
+            
+            # Entangle with second enemy using CNOT gates
+            qc.cx(range(self.num_qubits), range(self.num_qubits, self.num_qubits * 2))
+            
+            self._bell_template = transpile(qc, self.simulator, optimization_level=3)
         
-        return qc
+        return self._bell_template.copy()
     
     def apply_cnot_damage(self, qc: QuantumCircuit, control_qubits: List[int], 
                           target_qubits: List[int]) -> QuantumCircuit:
@@ -0,0 +1,77 @@
+"""
+Quantum Worker - Runs Qiskit measurements off the game loop thread
+"""
+
+import queue
+import threading
+import logging
+import numpy as np
+from typing import Any, Hashable, List, Optional, Tuple
+from qiskit import QuantumCircuit
+
+logger = logging.getLogger(__name__)
+
+
+class QuantumWorker:
+    """Background thread that owns Qiskit simulator calls"""
+    
+    def __init__(self, quantum_state_manager):
+        """
+        Initialize and start the worker thread
+        
+        Args:
+            quantum_state_manager: Quantum state manager used for measurement
+        """
+        self.quantum_state_manager = quantum_state_manager
+        self._rng = np.random.default_rng()  # Owned by the worker thread
+        self._requests: queue.SimpleQueue = queue.SimpleQueue()
+        self._results: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="QuantumWorker", daemon=True)
+        self._thread.start()
+    
+    def submit_measurements(self, keys: List[Hashable], circuits: List[QuantumCircuit]):
+        """
+        Queue circuits for one batched measurement
+        
+        Circuits are copied here, so callers may keep modifying them.
+        
+        Args:
+            keys: Caller keys, returned alongside each result
+            circuits: Quantum circuits to measure
+        """
+        self._requests.put((list(keys), [qc.copy() for qc in circuits]))
+    
+    def drain(self) -> List[Tuple[Any, Optional[int]]]:
+        """
+        Collect all finished measurements without blocking
+        
+        Returns:
+            List of (key, path_index) tuples; path_index is None if
+            the measurement failed
+        """
+        results = []
+        while True:
+            try:
+                results.extend(self._results.get_nowait())
+            except queue.Empty:
+                return results
+    
+    def shutdown(self):
+        """Stop the worker thread"""
+        self._requests.put(None)
+        self._thread.join(timeout=1.0)
+    
+    def _run(self):
+        """Worker loop: measure each queued batch with a single simulator call"""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            
+            keys, circuits = request
+            try:
+                paths = self.quantum_state_manager.batch_measure(circuits, rng=self._rng)
+            except Exception:
+                logger.exception("Batched measurement failed")
+                paths = [None] * len(keys)
+            self._results.put(list(zip(keys, paths)))
@@ -0,0 +1,49 @@
+"""
+Render Kernels - JIT-compiled per-frame enemy draw math
+Falls back to plain Python when Numba is not installed
+"""
+
+import numpy as np
+
+from config._numba_compat import NUMBA_AVAILABLE, njit
+
+MIN_DRAW_PROBABILITY = 0.01  # Superposition images fainter than this are skipped
+
+
+@njit(cache=True, fastmath=True)
+def compute_draw_params(path_idxs, progresses, probs, path_lut):
+    """
+    Compute screen positions and opacity for every enemy image
+
+    Args:
+        path_idxs: Path of each image, shape (N,)
+        progresses: Progress along that path, shape (N,)
+        probs: Probability of each image (1.0 for measured enemies), shape (N,)
+        path_lut: Sampled path positions, shape (P, S, 2)
+
+    Returns:
+        (xs, ys, alphas, keep) arrays of shape (N,): integer centers,
+        alpha bytes, and a mask of images worth drawing
+    """
+    n = path_idxs.shape[0]
+    last = path_lut.shape[1] - 1
+    xs = np.empty(n, dtype=np.int32)
+    ys = np.empty(n, dtype=np.int32)
+    alphas = np.empty(n, dtype=np.int32)
+    keep = np.empty(n, dtype=np.bool_)
+
+    for i in range(n):
+        keep[i] = probs[i] >= MIN_DRAW_PROBABILITY
+        if not keep[i]:
+            continue
+
+        # Interpolate between the two nearest samples
+        p = path_idxs[i]
+        f = min(max(progresses[i], 0.0), 1.0) * last
+        k = min(int(f), last - 1)
+        t = f - k
+        xs[i] = int(path_lut[p, k, 0] + (path_lut[p, k + 1, 0] - path_lut[p, k, 0]) * t)
+        ys[i] = int(path_lut[p, k, 1] + (path_lut[p, k + 1, 1] - path_lut[p, k, 1]) * t)
+        alphas[i] = int(probs[i] * 255)
+
+    return xs, ys, alphas, keep
@@ -9,263 +9,300 @@ import math
 from typing import List, Tuple
 import time
 
+_DEFAULT_FONT = None  # Shared damage-number font, loaded on first use
 
-class Particle:
-    """Single particle for effects"""
-    
-    def __init__(self, x, y, vx, vy, color, lifetime, size=3):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = 0.1
-    
-    def update(self, delta_time):
-        """Update particle position"""
-        self.x += self.vx * delta_time * 60
-        self.y += self.vy * delta_time * 60
-        self.vy += self.gravity
-        self.lifetime -= delta_time
+
+def _get_font() -> pygame.font.Font:
+    """Get the shared effects font, loading it once"""
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        _DEFAULT_FONT = pygame.font.Font(None, 20)
+    return _DEFAULT_FONT
+
+
+# Pre-rendered filled circles keyed by (radius, color, alpha bucket)
+ALPHA_BUCKETS = 16
+_circle_cache = {}
+
+
+def get_circle_surface(radius: int, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """
+    Get a cached filled circle surface
     
-    def is_alive(self):
-        """Check if particle is still alive"""
-        return self.lifetime > 0
+    Alpha is quantized to ALPHA_BUCKETS levels so a handful of surfaces
+    cover every fade step.
     
-    def get_alpha(self):
-        """Get transparency based on remaining lifetime"""
-        return int(255 * (self.lifetime / self.max_lifetime))
+    Args:
+        radius: Circle radius in pixels
+        color: RGB color
+        alpha: Opacity, 0-255
+        
+    Returns:
+        Surface of size (2*radius, 2*radius); do not modify
+    """
+    bucket = max(0, min(255, alpha)) >> 4
+    key = (radius, color, bucket)
+    surf = _circle_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, bucket * 255 // (ALPHA_BUCKETS - 1)),
+                           (radius, radius), radius)
+        surf = surf.convert_alpha()
+        _circle_cache[key] = surf
+    return surf
 
 
 class MeasurementEffect:
     """Visual effect for wave function collapse"""
     
-    def __init__(self, position: Tuple[float, float], color: Tuple[int, int, int]):
+    # (color, radius, alpha) -> finished glow rings; radius and alpha both
+    # follow progress, so each color needs at most ~340 entries
+    _rings = {}
+    
+    def __init__(self, position: Tuple[float, float], color: Tuple[int, int, int], now: float):
         self.position = position
         self.color = color
-        self.start_time = time.time()
+        self.start_time = now
         self.duration = 0.5  # seconds
+        self.end_time = now + self.duration
         self.max_radius = 80
+    
+    @classmethod
+    def _get_rings(cls, color: Tuple[int, int, int], radius: int, alpha: int) -> pygame.Surface:
+        """
+        Get the three glow rings for one frame's radius and alpha, drawn once
+        
+        Args:
+            color: RGB ring color
+            radius: Outer ring radius in pixels (1 to max_radius)
+            alpha: Opacity of the outer ring
+        
+        Returns:
+            Surface of size (2*radius, 2*radius); do not modify
+        """
+        key = (color, radius, alpha)
+        surf = cls._rings.get(key)
+        if surf is None:
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            
+            # Draw multiple circles for glow effect
+            for i in range(3):
+                circle_radius = radius - i * 5
+                if circle_radius > 0:
+                    pygame.draw.circle(surf, (*color, alpha // (i + 1)), (radius, radius), circle_radius, 2)
+            
+            surf = surf.convert_alpha()
+            cls._rings[key] = surf
+        return surf
 
-    def update(self, delta_time=0):
+    def update(self, delta_time, now):
         """Update effect state"""
-        elapsed = time.time() - self.start_time
-        return elapsed < self.duration
+        return now < self.end_time
     
-    def render(self, screen):
+    def render(self, screen, now):
         """Render measurement collapse effect"""
-        elapsed = time.time() - self.start_time
+        elapsed = now - self.start_time
         progress = min(1.0, elapsed / self.duration)
         
         # Expanding circle
         radius = int(self.max_radius * progress)
         alpha = int(255 * (1 - progress))
+        if radius <= 0 or alpha <= 0:
+            return
         
-        # Create surface with alpha
-        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        
-        # Draw multiple circles for glow effect
-        for i in range(3):
-            circle_radius = radius - i * 5
-            if circle_radius > 0:
-                circle_alpha = alpha // (i + 1)
-                color_with_alpha = (*self.color, circle_alpha)
-                pygame.draw.circle(surf, color_with_alpha, (radius, radius), circle_radius, 2)
-        
+        # Blit the cached rings; a per-surface alpha would slow the blit
+        surf = self._get_rings(self.color, radius, alpha)
         screen.blit(surf, (self.position[0] - radius, self.position[1] - radius))
 
 
 class SuperpositionEffect:
     """Quantum superposition visual effect"""
     
-    def __init__(self, positions: List[Tuple[float, float]], color: Tuple[int, int, int]):
+    def __init__(self, positions: List[Tuple[float, float]], color: Tuple[int, int, int], now: float):
         self.positions = positions
         self.color = color
-        self.start_time = time.time()
+        self.start_time = now
         self.duration = 0.3
+        self.end_time = now + self.duration
     
-    def update(self):
+    def update(self, delta_time, now):
         """Update effect state"""
-        elapsed = time.time() - self.start_time
-        return elapsed < self.duration
+        return now < self.end_time
     
-    def render(self, screen):
+    def render(self, screen, now):
         """Render superposition shimmer"""
-        elapsed = time.time() - self.start_time
+        elapsed = now - self.start_time
         progress = min(1.0, elapsed / self.duration)
         
         alpha = int(128 * math.sin(progress * math.pi * 4))
         
+        surf = get_circle_surface(15, self.color, abs(alpha))
         for pos in self.positions:
-            surf = pygame.Surface((30, 30), pygame.SRCALPHA)
-            color_with_alpha = (*self.color, abs(alpha))
-            pygame.draw.circle(surf, color_with_alpha, (15, 15), 15)
             screen.blit(surf, (pos[0] - 15, pos[1] - 15))
 
 
 class EntanglementEffect:
     """Visual effect for quantum entanglement"""
     
-    def __init__(self, pos1: Tuple[float, float], pos2: Tuple[float, float], color: Tuple[int, int, int]):
+    PARTICLE_COUNT = 10
+    PARTICLE_LIFETIME = 0.4
+    PARTICLE_SIZE = 4
+    GRAVITY = 0.1
+    
+    def __init__(self, pos1: Tuple[float, float], pos2: Tuple[float, float], color: Tuple[int, int, int],
+                 now: float):
         self.pos1 = pos1
         self.pos2 = pos2
         self.color = color
-        self.start_time = time.time()
+        self.start_time = now
         self.duration = 0.4
-        self.particles = []
+        self.end_time = now + self.duration
         
-        # Create particles along the line
-        steps = 10
-        for i in range(steps):
-            t = i / steps
-            x = pos1[0] + (pos2[0] - pos1[0]) * t
-            y = pos1[1] + (pos2[1] - pos1[1]) * t
-            angle = np.random.random() * math.pi * 2
-            speed = 2
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.particles.append(Particle(x, y, vx, vy, color, 0.4, size=4))
-    
-    def update(self, delta_time):
+        # Particles along the line, stored as parallel arrays
+        steps = self.PARTICLE_COUNT
+        t = np.arange(steps) / steps
+        self.px = pos1[0] + (pos2[0] - pos1[0]) * t
+        self.py = pos1[1] + (pos2[1] - pos1[1]) * t
+        angles = np.random.random(steps) * (math.pi * 2)
+        speed = 2
+        self.vx = np.cos(angles) * speed
+        self.vy = np.sin(angles) * speed
+        self.life = np.full(steps, self.PARTICLE_LIFETIME)
+        self._alive_count = steps
+    
+    def update(self, delta_time, now):
         """Update effect state"""
-        for particle in self.particles:
-            particle.update(delta_time)
+        step = delta_time * 60
+        self.px += self.vx * step
+        self.py += self.vy * step
+        self.vy += self.GRAVITY
+        self.life -= delta_time
+        if self._alive_count:
+            self._alive_count = int(np.count_nonzero(self.life > 0))
         
-        elapsed = time.time() - self.start_time
-        return elapsed < self.duration
+        return now < self.end_time
     
-    def render(self, screen):
+    def render(self, screen, now):
         """Render entanglement particles"""
-        for particle in self.particles:
-            if particle.is_alive():
-                alpha = particle.get_alpha()
-                surf = pygame.Surface((particle.size * 2, particle.size * 2), pygame.SRCALPHA)
-                color_with_alpha = (*particle.color, alpha)
-                pygame.draw.circle(surf, color_with_alpha, (particle.size, particle.size), particle.size)
-                screen.blit(surf, (int(particle.x) - particle.size, int(particle.y) - particle.size))
+        if not self._alive_count:
+            return
+        
+        alive = np.flatnonzero(self.life > 0)
+        
+        size = self.PARTICLE_SIZE
+        alphas = (255 * self.life[alive] / self.PARTICLE_LIFETIME).astype(np.int32)
+        xs = self.px[alive].astype(np.int32) - size
+        ys = self.py[alive].astype(np.int32) - size
+        
+        for x, y, alpha in zip(xs.tolist(), ys.tolist(), alphas.tolist()):
+            screen.blit(get_circle_surface(size, self.color, alpha), (x, y))
 
 
 class DamageNumber:
     """Floating damage number"""
     
-    def __init__(self, position: Tuple[float, float], damage: int, color: Tuple[int, int, int]):
+    def __init__(self, position: Tuple[float, float], damage: int, color: Tuple[int, int, int],
+                 font: pygame.font.Font, now: float):
         self.x = position[0]
         self.y = position[1]
         self.damage = damage
         self.color = color
-        self.start_time = time.time()
+        self.start_time = now
         self.duration = 1.0
+        self.end_time = now + self.duration
         self.vy = -2  # Float upward
+        
+        # The text never changes, so rasterize it once
+        self._surf = font.render(f"-{damage}", True, color).convert_alpha()
     
-    def update(self, delta_time):
+    def update(self, delta_time, now):
         """Update position"""
         self.y += self.vy * delta_time * 60
-        elapsed = time.time() - self.start_time
-        return elapsed < self.duration
+        return now < self.end_time
     
-    def render(self, screen, font):
+    def render(self, screen, now):
         """Render damage number"""
-        elapsed = time.time() - self.start_time
+        elapsed = now - self.start_time
         progress = elapsed / self.duration
         alpha = int(255 * (1 - progress))
         
-        # Create text surface
-        text = font.render(f"-{self.damage}", True, self.color)
-        
-        # Create surface with alpha
-        surf = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-        surf.blit(text, (0, 0))
-        surf.set_alpha(alpha)
-        
-        screen.blit(surf, (int(self.x) - 10, int(self.y)))
+        self._surf.set_alpha(alpha)
+        screen.blit(self._surf, (int(self.x) - 10, int(self.y)))
 
 
 class PhaseShiftEffect:
     """Visual effect for phase manipulation"""
     
-    def __init__(self, position: Tuple[float, float], target_path: int):
+    _BASE_ANGLES = np.arange(8) * (math.pi * 2 / 8)  # Evenly spaced ring particles
+    
+    def __init__(self, position: Tuple[float, float], target_path: int, now: float):
         self.position = position
         self.target_path = target_path
-        self.start_time = time.time()
+        self.start_time = now
         self.duration = 0.3
+        self.end_time = now + self.duration
         self.color = (255, 200, 100)
 
-    def update(self, delta_time=0):
+    def update(self, delta_time, now):
         """Update effect state"""
-        elapsed = time.time() - self.start_time
-        return elapsed < self.duration
+        return now < self.end_time
     
-    def render(self, screen):
+    def render(self, screen, now):
         """Render phase shift ripple"""
-        elapsed = time.time() - self.start_time
+        elapsed = now - self.start_time
         progress = elapsed / self.duration
         
+        alpha = int(255 * (1 - progress))
+        if alpha <= 0:
+            return
+        
         # Rotating particles
-        num_particles = 8
         radius = 30 + progress * 20
+        angles = self._BASE_ANGLES + progress * math.pi * 4
+        xs = (self.position[0] + np.cos(angles) * radius).astype(np.int32) - 4
+        ys = (self.position[1] + np.sin(angles) * radius).astype(np.int32) - 4
         
-        for i in range(num_particles):
-            angle = (i / num_particles) * math.pi * 2 + progress * math.pi * 4
-            x = self.position[0] + math.cos(angle) * radius
-            y = self.position[1] + math.sin(angle) * radius
-            
-            alpha = int(255 * (1 - progress))
-            if alpha>0:
-                surf = pygame.Surface((8, 8), pygame.SRCALPHA)
-                color_with_alpha = (*self.color, alpha)
-                pygame.draw.circle(surf, color_with_alpha, (4, 4), 4)
-                screen.blit(surf, (int(x) - 4, int(y) - 4))
+        surf = get_circle_surface(4, self.color, alpha)
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            screen.blit(surf, (x, y))
 
 
 class TeleportationEffect:
     """Visual effect for quantum teleportation"""
     
-    def __init__(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float]):
+    STEPS = 8
+    
+    def __init__(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float], now: float):
         self.start_pos = start_pos
         self.end_pos = end_pos
-        self.start_time = time.time()
+        self.start_time = now
         self.duration = 0.2
+        self.end_time = now + self.duration
         self.color = (100, 255, 255)
+        
+        # Lightning bolt polyline and its jitter, sampled once; the
+        # endpoints stay fixed
+        t = np.arange(self.STEPS + 1)[:, None] / self.STEPS
+        start = np.asarray(start_pos, dtype=float)
+        self._points = start + (np.asarray(end_pos, dtype=float) - start) * t
+        self._jitter = np.random.uniform(-1.0, 1.0, size=self._points.shape)
+        self._jitter[[0, -1]] = 0.0
     
-    def update(self, delta_time=0):
+    def update(self, delta_time, now):
         """Update effect state"""
-        elapsed = time.time() - self.start_time
-        return elapsed < self.duration
+        return now < self.end_time
     
-    def render(self, screen):
+    def render(self, screen, now):
         """Render teleportation beam"""
-        elapsed = time.time() - self.start_time
+        elapsed = now - self.start_time
         progress = elapsed / self.duration
         
-        # Lightning bolt effect
-        steps = 8
-        points = [self.start_pos]
-        
-        for i in range(1, steps):
-            t = i / steps
-            x = self.start_pos[0] + (self.end_pos[0] - self.start_pos[0]) * t
-            y = self.start_pos[1] + (self.end_pos[1] - self.start_pos[1]) * t
-            
-            # Add randomness
-            offset = 10 * math.sin(progress * math.pi)
-            x += np.random.uniform(-offset, offset)
-            y += np.random.uniform(-offset, offset)
-            
-            points.append((x, y))
-        
-        points.append(self.end_pos)
+        offset = 10 * math.sin(progress * math.pi)
+        points = (self._points + self._jitter * offset).tolist()
         
         # Draw the beam
         alpha = int(255 * (1 - progress))
-        if len(points) >= 2:
-            for i in range(len(points) - 1):
-                surf = pygame.Surface((abs(points[i+1][0] - points[i][0]) + 10, 
-                                     abs(points[i+1][1] - points[i][1]) + 10), pygame.SRCALPHA)
-                color_with_alpha = (*self.color, alpha)
-                pygame.draw.line(screen, color_with_alpha, points[i], points[i+1], 3)
+        pygame.draw.lines(screen, (*self.color, alpha), False, points, 3)
 
 
 class EffectsManager:
@@ -274,49 +311,71 @@ class EffectsManager:
     def __init__(self):
         self.effects = []
         self.damage_numbers = []
-        self.font = pygame.font.Font(None, 20)
+        self._now = time.monotonic()  # Frame timestamp shared by all effects
+    
+    @property
+    def font(self) -> pygame.font.Font:
+        """Font used for damage numbers, shared by all managers"""
+        return _get_font()
     
     def add_measurement_effect(self, position: Tuple[float, float], color=(100, 255, 100)):
         """Add wave function collapse effect"""
-        self.effects.append(MeasurementEffect(position, color))
+        self.effects.append(MeasurementEffect(position, color, self._now))
     
     def add_superposition_effect(self, positions: List[Tuple[float, float]], color=(100, 180, 255)):
         """Add superposition shimmer"""
-        self.effects.append(SuperpositionEffect(positions, color))
+        self.effects.append(SuperpositionEffect(positions, color, self._now))
     
     def add_entanglement_effect(self, pos1: Tuple[float, float], pos2: Tuple[float, float], 
                                 color=(200, 100, 255)):
         """Add entanglement link effect"""
-        self.effects.append(EntanglementEffect(pos1, pos2, color))
+        self.effects.append(EntanglementEffect(pos1, pos2, color, self._now))
     
     def add_phase_shift_effect(self, position: Tuple[float, float], target_path: int):
         """Add phase manipulation effect"""
-        self.effects.append(PhaseShiftEffect(position, target_path))
+        self.effects.append(PhaseShiftEffect(position, target_path, self._now))
     
     def add_teleportation_effect(self, start_pos: Tuple[float, float], end_pos: Tuple[float, float]):
         """Add quantum teleportation beam"""
-        self.effects.append(TeleportationEffect(start_pos, end_pos))
+        self.effects.append(TeleportationEffect(start_pos, end_pos, self._now))
     
     def add_damage_number(self, position: Tuple[float, float], damage: int, color=(255, 100, 100)):
         """Add floating damage number"""
-        self.damage_numbers.append(DamageNumber(position, damage, color))
+        self.damage_numbers.append(DamageNumber(position, damage, color, self.font, self._now))
     
     def update(self, delta_time: float):
         """Update all effects"""
-        # Update and remove dead effects
-        self.effects = [effect for effect in self.effects if effect.update(delta_time)]
-
+        now = self._now = time.monotonic()
+        
+        # Update and remove dead effects, compacting in place
+        self._update_in_place(self.effects, delta_time, now)
+        self._update_in_place(self.damage_numbers, delta_time, now)
+    
+    @staticmethod
+    def _update_in_place(items: list, delta_time: float, now: float):
+        """
+        Update items and drop finished ones without reallocating the list
         
-        # Update damage numbers
-        self.damage_numbers = [num for num in self.damage_numbers if num.update(delta_time)]
+        Args:
+            items: Effects to update; modified in place
+            delta_time: Time since last frame
+            now: Frame timestamp
+        """
+        j = 0
+        for item in items:
+            if item.update(delta_time, now):
+                items[j] = item
+                j += 1
+        del items[j:]
     
     def render(self, screen):
         """Render all effects"""
+        now = self._now
         for effect in self.effects:
-            effect.render(screen)
+            effect.render(screen, now)
         
         for num in self.damage_numbers:
-            num.render(screen, self.font)
+            num.render(screen, now)
     
     def clear_all(self):
         """Clear all effects"""
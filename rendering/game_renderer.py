@@ -6,9 +6,24 @@ import pygame
 import numpy as np
 import logging
 from config.game_config import *
+from ._render_numba import NUMBA_AVAILABLE, MIN_DRAW_PROBABILITY, compute_draw_params
 
 logger = logging.getLogger(__name__)
 
+# Visible play field; the UI panel covers everything below it
+_VIEW_BOTTOM = SCREEN_HEIGHT - UI_PANEL_HEIGHT
+
+# How far an enemy image (circle, health bar, probability label) reaches from its center
+_ENEMY_EXTENT = 32
+
+# Base color of each tower type
+_TOWER_COLORS = {
+    'measurement': COLORS['tower_measurement'],
+    'phase': COLORS['tower_phase'],
+    'entanglement': COLORS['tower_entanglement'],
+    'teleportation': COLORS['tower_teleportation']
+}
+
 
 class GameRenderer:
     """Handles all game rendering"""
@@ -35,8 +50,87 @@ class GameRenderer:
             self.font_large = pygame.font.SysFont('arial', 48)
             self.font_title = pygame.font.SysFont('arial', 72)
         
+        # Rendered text surfaces keyed by (font, string, color)
+        self._text_cache = {}
+        
+        # Translucent range circles keyed by (color, radius, alpha, width)
+        self._range_surfs = {}
+        
+        # Superposed enemy images keyed by alpha (at most 256)
+        self._ghost_surfs = {}
+        
+        # Tower placement preview squares keyed by color
+        self._preview_surfs = {}
+        
+        # Reused for per-frame rect draws instead of allocating a Rect each time
+        self._scratch_rect = pygame.Rect(0, 0, 0, 0)
+        
+        # Enemy health bar background, shared by every bar
+        self._hbar_bg = pygame.Surface((30, 4)).convert()
+        self._hbar_bg.fill((50, 50, 50))
+        
+        # Fullscreen dimming overlays, filled once
+        self._overlay_180 = self._make_overlay(180)
+        self._overlay_200 = self._make_overlay(200)
+        
         logger.info("Game Renderer initialized")
     
+    def _text(self, font, text, color):
+        """
+        Render text once and reuse the surface on later calls
+        
+        Args:
+            font: Pygame font
+            text: String to render
+            color: Text color
+        
+        Returns:
+            Cached text surface; do not modify
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    @staticmethod
+    def _make_overlay(alpha):
+        """
+        Build a fullscreen black overlay
+        
+        Args:
+            alpha: Overlay opacity
+        
+        Returns:
+            Screen-sized translucent surface
+        """
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, alpha))
+        return overlay.convert_alpha()
+    
+    def _range_surface(self, color, radius, alpha, width=0):
+        """
+        Get a cached translucent range circle
+        
+        Args:
+            color: RGB color
+            radius: Circle radius in pixels
+            alpha: Circle opacity
+            width: Outline width (0 for filled)
+        
+        Returns:
+            Surface of size (2*radius, 2*radius); do not modify
+        """
+        key = (color, radius, alpha, width)
+        surface = self._range_surfs.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius, width)
+            surface = surface.convert_alpha()
+            self._range_surfs[key] = surface
+        return surface
+    
     def render_paths(self):
         """Render all enemy paths"""
         for i, path in enumerate(PATHS):
@@ -50,7 +144,7 @@ class GameRenderer:
             )
             
             # Draw path number at start
-            text = self.font_small.render(f"Path {i}", True, COLORS['ui_text'])
+            text = self._text(self.font_small, f"Path {i}", COLORS['ui_text'])
             self.screen.blit(text, (path[0][0] + 10, path[0][1] - 20))
     
     def render_enemies(self, enemies, quantum_manager):
@@ -61,8 +155,58 @@ class GameRenderer:
             enemies: List of enemy objects
             quantum_manager: Quantum state manager
         """
+        # Gather every (path, progress, probability) an enemy may be drawn
+        # at; measured enemies get probability 1 on their collapsed path
+        items = []
+        path_idxs = []
+        progresses = []
+        probs = []
         for enemy in enemies:
-            self.render_single_enemy(enemy, quantum_manager)
+            if enemy.is_measured:
+                items.append(enemy)
+                path_idxs.append(enemy.measured_path)
+                progresses.append(enemy.position_progress)
+                probs.append(1.0)
+            else:
+                for path_idx, prob in enemy.get_active_paths(quantum_manager):
+                    items.append(None)
+                    path_idxs.append(path_idx)
+                    progresses.append(enemy.position_progress)
+                    probs.append(prob)
+        
+        if not items:
+            return
+        
+        path_idxs = np.array(path_idxs, dtype=np.intp)
+        progresses = np.array(progresses, dtype=np.float32)
+        probs = np.array(probs, dtype=np.float64)
+        
+        if NUMBA_AVAILABLE:
+            xs, ys, alphas, keep = compute_draw_params(path_idxs, progresses, probs, PATH_LUT)
+        else:
+            keep = probs >= MIN_DRAW_PROBABILITY
+            positions = get_positions_on_paths(path_idxs, progresses).astype(np.int32)
+            xs, ys = positions[:, 0], positions[:, 1]
+            alphas = (probs * 255).astype(np.int32)
+        
+        # Cull images that are offscreen or hidden behind the UI panel
+        keep &= ((xs > -_ENEMY_EXTENT) & (xs < SCREEN_WIDTH + _ENEMY_EXTENT)
+                 & (ys > -_ENEMY_EXTENT) & (ys < _VIEW_BOTTOM + _ENEMY_EXTENT))
+        
+        blit_list = []
+        for enemy, x, y, prob, alpha, draw in zip(items, xs.tolist(), ys.tolist(),
+                                                  probs.tolist(), alphas.tolist(), keep.tolist()):
+            if not draw:
+                continue
+            if enemy is not None:
+                # Flush queued ghosts first so list order stays the draw order
+                if blit_list:
+                    self.screen.blits(blit_list, doreturn=False)
+                    blit_list.clear()
+                self._draw_measured_enemy(enemy, x, y)
+            else:
+                self._draw_superposed_enemy(x, y, prob, alpha, blit_list)
+        self.screen.blits(blit_list, doreturn=False)
     
     def render_single_enemy(self, enemy, quantum_manager):
         """
@@ -72,70 +216,81 @@ class GameRenderer:
             enemy: Enemy object
             quantum_manager: Quantum state manager
         """
-        if enemy.is_measured:
-            # Render solid enemy on measured path
-            pos = get_position_on_path(enemy.measured_path, enemy.position_progress)
-            
-            # Choose color based on entanglement
-            if enemy.is_entangled:
-                color = COLORS['enemy_entangled']
-            else:
-                color = COLORS['enemy_measured']
+        self.render_enemies([enemy], quantum_manager)
+    
+    def _draw_measured_enemy(self, enemy, x, y):
+        """
+        Draw a collapsed enemy on its measured path
+        
+        Args:
+            enemy: Enemy object
+            x, y: Screen position
+        """
+        # Choose color based on entanglement
+        if enemy.is_entangled:
+            color = COLORS['enemy_entangled']
+        else:
+            color = COLORS['enemy_measured']
+        
+        # Draw enemy circle
+        pygame.draw.circle(
+            self.screen,
+            color,
+            (x, y),
+            15
+        )
+        
+        # Draw border
+        pygame.draw.circle(
+            self.screen,
+            (255, 255, 255),
+            (x, y),
+            15,
+            2
+        )
+        
+        # Draw health bar
+        self.draw_health_bar((x, y), enemy.health, 100)
+    
+    def _draw_superposed_enemy(self, x, y, prob, alpha, blit_list):
+        """
+        Queue a semi-transparent enemy image on one possible path
+        
+        Args:
+            x, y: Screen position
+            prob: Probability of the enemy being on this path
+            alpha: Image opacity
+            blit_list: List collecting (surface, dest) pairs
+        """
+        s = self._ghost_surfs.get(alpha)
+        if s is None:
+            # Create alpha surface for transparency
+            s = pygame.Surface((32, 32), pygame.SRCALPHA)
             
-            # Draw enemy circle
-            pygame.draw.circle(
-                self.screen,
-                color,
-                (int(pos[0]), int(pos[1])),
-                15
-            )
+            # Draw semi-transparent circle
+            color = (*COLORS['enemy_superposition'][:3], alpha)
+            pygame.draw.circle(s, color, (16, 16), 15)
             
             # Draw border
-            pygame.draw.circle(
-                self.screen,
-                (255, 255, 255),
-                (int(pos[0]), int(pos[1])),
-                15,
-                2
-            )
-            
-            # Draw health bar
-            self.draw_health_bar(pos, enemy.health, 100)
-        else:
-            # Render semi-transparent on all paths with probabilities
-            paths = enemy.get_active_paths(quantum_manager)
+            border_color = (*COLORS['ui_text'], min(255, alpha + 50))
+            pygame.draw.circle(s, border_color, (16, 16), 15, 2)
             
-            for path_idx, prob in paths:
-                if prob < 0.01:  # Skip very low probabilities
-                    continue
-                
-                pos = get_position_on_path(path_idx, enemy.position_progress)
-                
-                # Create alpha surface for transparency
-                alpha = int(prob * 255)
-                s = pygame.Surface((32, 32), pygame.SRCALPHA)
-                
-                # Draw semi-transparent circle
-                color = (*COLORS['enemy_superposition'][:3], alpha)
-                pygame.draw.circle(s, color, (16, 16), 15)
-                
-                # Draw border
-                border_color = (*COLORS['ui_text'], min(255, alpha + 50))
-                pygame.draw.circle(s, border_color, (16, 16), 15, 2)
-                
-                # Blit to screen
-                self.screen.blit(s, (int(pos[0]) - 16, int(pos[1]) - 16))
-                
-                # Show probability
-                prob_text = self.font_small.render(
-                    f"{int(prob*100)}%",
-                    True,
-                    COLORS['ui_text']
-                )
-                self.screen.blit(
-                    prob_text,
-                    (int(pos[0]) - 15, int(pos[1]) - 30)
-                )
+            s = s.convert_alpha()
+            self._ghost_surfs[alpha] = s
+        
+        # Queue for the batched blit
+        blit_list.append((s, (x - 16, y - 16)))
+        
+        # Show probability
+        prob_text = self._text(
+            self.font_small,
+            f"{int(prob*100)}%",
+            COLORS['ui_text']
+        )
+        blit_list.append((
+            prob_text,
+            (x - 15, y - 30)
+        ))
     
     def draw_health_bar(self, pos, current_health, max_health):
         """
@@ -150,20 +305,18 @@ class GameRenderer:
         bar_height = 4
         health_ratio = max(0, current_health / max_health)
         fill_width = int(bar_width * health_ratio)
+        left = int(pos[0]) - bar_width // 2
+        top = int(pos[1]) - 22
         
         # Background
-        pygame.draw.rect(
-            self.screen,
-            (50, 50, 50),
-            (pos[0] - bar_width//2, pos[1] - 22, bar_width, bar_height)
-        )
+        self.screen.blit(self._hbar_bg, (left, top))
         
         # Health fill
         if fill_width > 0:
             pygame.draw.rect(
                 self.screen,
                 COLORS['health_bar'],
-                (pos[0] - bar_width//2, pos[1] - 22, fill_width, bar_height)
+                (left, top, fill_width, bar_height)
             )
     
     def render_towers(self, towers):
@@ -173,56 +326,55 @@ class GameRenderer:
         Args:
             towers: List of tower objects
         """
+        blit_list = []
         for tower in towers:
-            self.render_single_tower(tower)
+            self.render_single_tower(tower, blit_list)
+        self.screen.blits(blit_list, doreturn=False)
     
-    def render_single_tower(self, tower):
+    def render_single_tower(self, tower, blit_list=None):
         """
         Render a single tower
         
         Args:
             tower: Tower object
+            blit_list: Optional list collecting (surface, dest) pairs for a
+                       batched blit; if None, they are blitted here
         """
+        if blit_list is None:
+            blit_list = []
+            self.render_single_tower(tower, blit_list)
+            self.screen.blits(blit_list, doreturn=False)
+            return
+        
         # Get tower color
-        color_map = {
-            'measurement': COLORS['tower_measurement'],
-            'phase': COLORS['tower_phase'],
-            'entanglement': COLORS['tower_entanglement'],
-            'teleportation': COLORS['tower_teleportation']
-        }
-        color = color_map.get(tower.tower_type, (255, 255, 255))
+        color = _TOWER_COLORS.get(tower.tower_type, (255, 255, 255))
+        x = int(tower.position[0])
+        y = int(tower.position[1])
+        r = int(tower.range)
+        
+        # Skip towers whose range circle lies entirely outside the play field
+        if x + r < 0 or x - r >= SCREEN_WIDTH or y + r < 0 or y - r >= _VIEW_BOTTOM:
+            return
         
         # Draw tower base
-        tower_rect = pygame.Rect(
-            tower.position[0] - 20,
-            tower.position[1] - 20,
-            40,
-            40
-        )
+        tower_rect = self._scratch_rect
+        tower_rect.update(x - 20, y - 20, 40, 40)
         pygame.draw.rect(self.screen, color, tower_rect)
         pygame.draw.rect(self.screen, (255, 255, 255), tower_rect, 2)
         
         # Draw range circle (semi-transparent)
-        range_surface = pygame.Surface((int(tower.range * 2), int(tower.range * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(
-            range_surface,
-            (*color, 30),
-            (int(tower.range), int(tower.range)),
-            int(tower.range)
-        )
-        self.screen.blit(
-            range_surface,
-            (tower.position[0] - tower.range, tower.position[1] - tower.range)
-        )
+        range_surface = self._range_surface(color, r, 30)
+        blit_list.append((range_surface, (x - r, y - r)))
         
         # Draw tower type icon/letter
-        icon_text = self.font_medium.render(
+        icon_text = self._text(
+            self.font_medium,
             tower.tower_type[0].upper(),
-            True,
             (0, 0, 0)
         )
-        icon_rect = icon_text.get_rect(center=tower.position)
-        self.screen.blit(icon_text, icon_rect)
+        # Center on the tower without allocating a Rect
+        icon_pos = (x - icon_text.get_width() // 2, y - icon_text.get_height() // 2)
+        blit_list.append((icon_text, icon_pos))
     
     def render_tower_preview(self, mouse_pos, tower_type, is_valid):
         """
@@ -233,46 +385,29 @@ class GameRenderer:
             tower_type: Type of tower being placed
             is_valid: Whether placement is valid
         """
-        color_map = {
-            'measurement': COLORS['tower_measurement'],
-            'phase': COLORS['tower_phase'],
-            'entanglement': COLORS['tower_entanglement'],
-            'teleportation': COLORS['tower_teleportation']
-        }
-        color = color_map.get(tower_type, (255, 255, 255))
+        color = _TOWER_COLORS.get(tower_type, (255, 255, 255))
         
         # Adjust color based on validity
         if not is_valid:
             color = (255, 50, 50)  # Red for invalid
         
         # Draw preview
-        preview_rect = pygame.Rect(
-            mouse_pos[0] - 20,
-            mouse_pos[1] - 20,
-            40,
-            40
-        )
+        preview_pos = (mouse_pos[0] - 20, mouse_pos[1] - 20)
         
-        s = pygame.Surface((40, 40), pygame.SRCALPHA)
-        pygame.draw.rect(s, (*color, 128), (0, 0, 40, 40))
-        pygame.draw.rect(s, (*color, 255), (0, 0, 40, 40), 2)
+        s = self._preview_surfs.get(color)
+        if s is None:
+            s = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.rect(s, (*color, 128), (0, 0, 40, 40))
+            pygame.draw.rect(s, (*color, 255), (0, 0, 40, 40), 2)
+            s = s.convert_alpha()
+            self._preview_surfs[color] = s
         
-        self.screen.blit(s, preview_rect)
+        self.screen.blit(s, preview_pos)
         
         # Draw range circle
-        tower_range = TOWER_CONFIG[tower_type]['range']
-        range_surface = pygame.Surface((int(tower_range * 2), int(tower_range * 2)), pygame.SRCALPHA)
-        pygame.draw.circle(
-            range_surface,
-            (*color, 50),
-            (int(tower_range), int(tower_range)),
-            int(tower_range),
-            2
-        )
-        self.screen.blit(
-            range_surface,
-            (mouse_pos[0] - tower_range, mouse_pos[1] - tower_range)
-        )
+        r = int(TOWER_CONFIG[tower_type]['range'])
+        range_surface = self._range_surface(color, r, 50, 2)
+        self.screen.blit(range_surface, (mouse_pos[0] - r, mouse_pos[1] - r))
     
     def render_entanglement_lines(self, entangled_pairs):
         """
@@ -281,32 +416,37 @@ class GameRenderer:
         Args:
             entangled_pairs: List of entangled enemy pairs
         """
+        # Gather both endpoints of every measured pair, then look up all
+        # positions in one vectorized pass
+        path_idxs = []
+        progresses = []
         for pair in entangled_pairs:
-            if pair.enemy1.is_measured and pair.enemy2.is_measured:
-                pos1 = get_position_on_path(
-                    pair.enemy1.measured_path,
-                    pair.enemy1.position_progress
-                )
-                pos2 = get_position_on_path(
-                    pair.enemy2.measured_path,
-                    pair.enemy2.position_progress
-                )
-                
-                # Draw wavy entanglement line
-                pygame.draw.line(
-                    self.screen,
-                    COLORS['enemy_entangled'],
-                    pos1,
-                    pos2,
-                    3
-                )
+            enemy1 = pair.enemy1
+            enemy2 = pair.enemy2
+            if enemy1.is_measured and enemy2.is_measured:
+                path_idxs.append(enemy1.measured_path)
+                path_idxs.append(enemy2.measured_path)
+                progresses.append(enemy1.position_progress)
+                progresses.append(enemy2.position_progress)
+        
+        if not path_idxs:
+            return
+        
+        # Pairs are disjoint segments, so draw.lines cannot join them;
+        # draw each with hoisted locals instead
+        points = get_positions_on_paths(path_idxs, progresses).tolist()
+        line = pygame.draw.line
+        screen = self.screen
+        color = COLORS['enemy_entangled']
+        for i in range(0, len(points), 2):
+            line(screen, color, points[i], points[i + 1], ENTANGLEMENT_LINE_WIDTH)
     
     def render_menu(self):
         """Render main menu"""
         # Title
-        title_text = self.font_title.render(
+        title_text = self._text(
+            self.font_title,
             "Quantum Tower Defense",
-            True,
             COLORS['ui_text']
         )
         title_rect = title_text.get_rect(
@@ -315,9 +455,9 @@ class GameRenderer:
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_medium.render(
+        subtitle_text = self._text(
+            self.font_medium,
             "IBM Qiskit Educational Game",
-            True,
             COLORS['quantum_coherence']
         )
         subtitle_rect = subtitle_text.get_rect(
@@ -337,7 +477,7 @@ class GameRenderer:
         
         y_offset = SCREEN_HEIGHT // 2 + 50
         for instruction in instructions:
-            text = self.font_medium.render(instruction, True, COLORS['ui_text'])
+            text = self._text(self.font_medium, instruction, COLORS['ui_text'])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 40
@@ -345,19 +485,17 @@ class GameRenderer:
     def render_pause_overlay(self):
         """Render pause overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay_180, (0, 0))
         
         # Pause text
-        pause_text = self.font_large.render("PAUSED", True, COLORS['ui_text'])
+        pause_text = self._text(self.font_large, "PAUSED", COLORS['ui_text'])
         pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(pause_text, pause_rect)
         
         # Resume instruction
-        resume_text = self.font_medium.render(
+        resume_text = self._text(
+            self.font_medium,
             "Press ESC or SPACE to Resume",
-            True,
             COLORS['quantum_coherence']
         )
         resume_rect = resume_text.get_rect(
@@ -368,12 +506,10 @@ class GameRenderer:
     def render_game_over(self, resource_manager):
         """Render game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay_200, (0, 0))
         
         # Game Over text
-        game_over_text = self.font_large.render("GAME OVER", True, (255, 100, 100))
+        game_over_text = self._text(self.font_large, "GAME OVER", (255, 100, 100))
         game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(game_over_text, game_over_rect)
         
@@ -389,7 +525,7 @@ class GameRenderer:
         
         y_offset = SCREEN_HEIGHT // 2
         for stat in stats:
-            text = self.font_medium.render(stat, True, COLORS['ui_text'])
+            text = self._text(self.font_medium, stat, COLORS['ui_text'])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 40
@@ -397,12 +533,10 @@ class GameRenderer:
     def render_victory(self, resource_manager):
         """Render victory screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay_200, (0, 0))
         
         # Victory text
-        victory_text = self.font_large.render("VICTORY!", True, COLORS['tower_measurement'])
+        victory_text = self._text(self.font_large, "VICTORY!", COLORS['tower_measurement'])
         victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         self.screen.blit(victory_text, victory_rect)
         
@@ -419,7 +553,7 @@ class GameRenderer:
         
         y_offset = SCREEN_HEIGHT // 2
         for stat in stats:
-            text = self.font_medium.render(stat, True, COLORS['ui_text'])
+            text = self._text(self.font_medium, stat, COLORS['ui_text'])
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             self.screen.blit(text, text_rect)
             y_offset += 40
@@ -6,6 +6,16 @@ Handles all UI elements, buttons, and player interactions
 import pygame
 from config.game_config import *
 
+# Tower selection buttons in panel order: (tower_type, color, icon letter)
+_TOWER_BUTTONS = (
+    ('measurement', COLORS['tower_measurement'], 'M'),
+    ('phase', COLORS['tower_phase'], 'P'),
+    ('entanglement', COLORS['tower_entanglement'], 'E'),
+    ('teleportation', COLORS['tower_teleportation'], 'T'),
+)
+_TOWER_TYPES = tuple(ttype for ttype, _, _ in _TOWER_BUTTONS)
+_TOWER_COLORS = {ttype: color for ttype, color, _ in _TOWER_BUTTONS}
+
 
 class UIManager:
     """Manages all user interface elements and interactions"""
@@ -31,6 +41,119 @@ class UIManager:
             self.font_medium = pygame.font.SysFont('arial', 24)
             self.font_small = pygame.font.SysFont('arial', 20)
             self.font_tiny = pygame.font.SysFont('arial', 18)
+        
+        # Tower buttons pre-rendered per (type, selected, affordable)
+        self._button_bg = self._build_tower_buttons()
+        
+        # Click targets, in _TOWER_TYPES order
+        self._tower_button_rects = [
+            pygame.Rect(380 + i * 115, SCREEN_HEIGHT - 90, 105, 80)
+            for i in range(len(_TOWER_TYPES))
+        ]
+        self._wave_button_rect = pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 85, 140, 45)
+        
+        # Panel background with its static labels, keyed by whether
+        # the START WAVE button is shown
+        self._panel_static = {show: self._build_panel(show) for show in (False, True)}
+        
+        # Tutorial overlay, rendered on first use
+        self._tutorial_surface = None
+        
+        # Tower tooltips; stats are static, so one surface per type
+        self._tooltips = {ttype: self._build_tooltip(ttype) for ttype in TOWER_CONFIG}
+    
+    def _build_tower_buttons(self):
+        """
+        Draw every tower selection button state once
+        
+        Returns:
+            Dict mapping (tower_type, is_selected, can_afford) to a 105x80 surface
+        """
+        buttons = {}
+        for i, (ttype, color, icon) in enumerate(_TOWER_BUTTONS):
+            cost = TOWER_CONFIG[ttype]['cost']
+            for is_selected in (False, True):
+                for can_afford in (False, True):
+                    button = pygame.Surface((105, 80), pygame.SRCALPHA)
+                    button_rect = button.get_rect()
+                    
+                    # Button background
+                    if is_selected:
+                        button_color = COLORS['button_hover']
+                        border_width = 4
+                    elif can_afford:
+                        button_color = COLORS['button']
+                        border_width = 2
+                    else:
+                        button_color = (40, 40, 40)
+                        border_width = 2
+                    
+                    pygame.draw.rect(button, button_color, button_rect, border_radius=8)
+                    
+                    # Button border (tower color)
+                    border_color = color if can_afford else (80, 80, 80)
+                    pygame.draw.rect(button, border_color, button_rect, width=border_width, border_radius=8)
+                    
+                    # Tower icon (large letter)
+                    icon_color = color if can_afford else (100, 100, 100)
+                    icon_text = self.font_large.render(icon, True, icon_color)
+                    button.blit(icon_text, icon_text.get_rect(center=(52, 22)))
+                    
+                    # Cost
+                    cost_color = COLORS['ui_text'] if can_afford else (150, 150, 150)
+                    cost_text = self.font_small.render(f"${cost}", True, cost_color)
+                    button.blit(cost_text, cost_text.get_rect(center=(52, 48)))
+                    
+                    # Hotkey indicator
+                    hotkey_text = self.font_tiny.render(f"[{i+1}]", True, COLORS['quantum_coherence'])
+                    button.blit(hotkey_text, hotkey_text.get_rect(center=(52, 68)))
+                    
+                    buttons[(ttype, is_selected, can_afford)] = button.convert_alpha()
+        return buttons
+    
+    def _build_panel(self, show_wave_button):
+        """
+        Draw the static layer of the bottom UI panel once
+        
+        Args:
+            show_wave_button: Whether to include the START WAVE button
+        
+        Returns:
+            Opaque SCREEN_WIDTH x UI_PANEL_HEIGHT surface
+        """
+        panel = pygame.Surface((SCREEN_WIDTH, UI_PANEL_HEIGHT))
+        panel_rect = panel.get_rect()
+        top = SCREEN_HEIGHT - UI_PANEL_HEIGHT
+        
+        # Panel fill and border
+        pygame.draw.rect(panel, COLORS['ui_panel'], panel_rect)
+        pygame.draw.rect(panel, COLORS['ui_text'], panel_rect, width=2)
+        
+        # Coherence label
+        coherence_text = self.font_small.render(
+            f"⚛️  Coherence:",
+            True,
+            COLORS['quantum_coherence']
+        )
+        panel.blit(coherence_text, (180, SCREEN_HEIGHT - 85 - top))
+        
+        # Coherence bar background
+        pygame.draw.rect(panel, (40, 40, 40), (180, SCREEN_HEIGHT - 60 - top, 120, 18), border_radius=4)
+        
+        # Wave start button
+        if show_wave_button:
+            wave_button_rect = pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 85 - top, 140, 45)
+            pygame.draw.rect(panel, (80, 180, 80), wave_button_rect, border_radius=10)
+            pygame.draw.rect(panel, (100, 255, 100), wave_button_rect, width=3, border_radius=10)
+            
+            wave_button_text = self.font_medium.render("START WAVE", True, (0, 0, 0))
+            panel.blit(wave_button_text, wave_button_text.get_rect(center=wave_button_rect.center))
+            
+            # Space key hint
+            space_hint = self.font_tiny.render("[SPACE]", True, (200, 255, 200))
+            panel.blit(space_hint, space_hint.get_rect(center=(wave_button_rect.centerx, SCREEN_HEIGHT - 30 - top)))
+        
+        return panel.convert()
     
     def render_ui(self, resource_manager, selected_tower, wave_active, fps):
         """
@@ -42,39 +165,38 @@ class UIManager:
             wave_active: Whether wave is currently active
             fps: Current frames per second
         """
-        # Draw bottom UI panel
-        panel_rect = pygame.Rect(0, SCREEN_HEIGHT - UI_PANEL_HEIGHT, SCREEN_WIDTH, UI_PANEL_HEIGHT)
-        pygame.draw.rect(self.screen, COLORS['ui_panel'], panel_rect)
+        # Read every displayed value once
+        money = resource_manager.money
+        lives = resource_manager.lives
+        coherence = resource_manager.quantum_coherence
+        max_coherence = resource_manager.max_coherence
+        wave = resource_manager.wave
+        score = resource_manager.score
         
-        # Draw panel border
-        pygame.draw.rect(self.screen, COLORS['ui_text'], panel_rect, width=2)
+        # Text is queued here and drawn with one blits() call at the end
+        blit_list = []
+        
+        # Static panel layer: fill, border, labels and wave button
+        self.screen.blit(self._panel_static[not wave_active], (0, SCREEN_HEIGHT - UI_PANEL_HEIGHT))
         
         # === LEFT SECTION: Resources ===
         
         # Money
         money_text = self.font_medium.render(
-            f"💰 ${resource_manager.money}",
+            f"💰 ${money}",
             True,
             COLORS['ui_text']
         )
-        self.screen.blit(money_text, (20, SCREEN_HEIGHT - 85))
+        blit_list.append((money_text, (20, SCREEN_HEIGHT - 85)))
         
         # Lives
-        lives_color = COLORS['health_bar'] if resource_manager.lives > 5 else (255, 100, 100)
+        lives_color = COLORS['health_bar'] if lives > 5 else (255, 100, 100)
         lives_text = self.font_medium.render(
-            f"❤️  {resource_manager.lives}",
+            f"❤️  {lives}",
             True,
             lives_color
         )
-        self.screen.blit(lives_text, (20, SCREEN_HEIGHT - 55))
-        
-        # Quantum Coherence with bar
-        coherence_text = self.font_small.render(
-            f"⚛️  Coherence:",
-            True,
-            COLORS['quantum_coherence']
-        )
-        self.screen.blit(coherence_text, (180, SCREEN_HEIGHT - 85))
+        blit_list.append((lives_text, (20, SCREEN_HEIGHT - 55)))
         
         # Coherence bar
         bar_width = 120
@@ -82,16 +204,8 @@ class UIManager:
         bar_x = 180
         bar_y = SCREEN_HEIGHT - 60
         
-        # Background
-        pygame.draw.rect(
-            self.screen,
-            (40, 40, 40),
-            (bar_x, bar_y, bar_width, bar_height),
-            border_radius=4
-        )
-        
         # Fill
-        fill_width = int(bar_width * (resource_manager.quantum_coherence / resource_manager.max_coherence))
+        fill_width = int(bar_width * (coherence / max_coherence))
         if fill_width > 0:
             pygame.draw.rect(
                 self.screen,
@@ -111,105 +225,47 @@ class UIManager:
         
         # Coherence text
         coherence_value_text = self.font_tiny.render(
-            f"{resource_manager.quantum_coherence:.1f}/{resource_manager.max_coherence}",
+            f"{coherence:.1f}/{max_coherence}",
             True,
             COLORS['ui_text']
         )
-        self.screen.blit(coherence_value_text, (bar_x + 5, bar_y + 2))
+        blit_list.append((coherence_value_text, (bar_x + 5, bar_y + 2)))
         
         # Wave number
         wave_text = self.font_small.render(
-            f"🌊 Wave {resource_manager.wave}",
+            f"🌊 Wave {wave}",
             True,
             COLORS['ui_text']
         )
-        self.screen.blit(wave_text, (180, SCREEN_HEIGHT - 35))
+        blit_list.append((wave_text, (180, SCREEN_HEIGHT - 35)))
         
         # === CENTER SECTION: Tower Selection ===
         
-        tower_types = ['measurement', 'phase', 'entanglement', 'teleportation']
-        tower_colors = [
-            COLORS['tower_measurement'],
-            COLORS['tower_phase'],
-            COLORS['tower_entanglement'],
-            COLORS['tower_teleportation']
-        ]
-        tower_icons = ['M', 'P', 'E', 'T']
-        
-        for i, (ttype, color, icon) in enumerate(zip(tower_types, tower_colors, tower_icons)):
+        for i, ttype in enumerate(_TOWER_TYPES):
             x = 380 + i * 115
             y = SCREEN_HEIGHT - 90
             
-            # Button rectangle
-            button_rect = pygame.Rect(x, y, 105, 80)
-            
             # Determine button state
             is_selected = (selected_tower == ttype)
-            can_afford = resource_manager.can_afford(TOWER_CONFIG[ttype]['cost'])
-            
-            # Button background
-            if is_selected:
-                button_color = COLORS['button_hover']
-                border_width = 4
-            elif can_afford:
-                button_color = COLORS['button']
-                border_width = 2
-            else:
-                button_color = (40, 40, 40)
-                border_width = 2
-            
-            pygame.draw.rect(self.screen, button_color, button_rect, border_radius=8)
-            
-            # Button border (tower color)
-            border_color = color if can_afford else (80, 80, 80)
-            pygame.draw.rect(self.screen, border_color, button_rect, width=border_width, border_radius=8)
-            
-            # Tower icon (large letter)
-            icon_color = color if can_afford else (100, 100, 100)
-            icon_text = self.font_large.render(icon, True, icon_color)
-            icon_rect = icon_text.get_rect(center=(x + 52, y + 22))
-            self.screen.blit(icon_text, icon_rect)
-            
-            # Cost
-            cost = TOWER_CONFIG[ttype]['cost']
-            cost_color = COLORS['ui_text'] if can_afford else (150, 150, 150)
-            cost_text = self.font_small.render(f"${cost}", True, cost_color)
-            cost_rect = cost_text.get_rect(center=(x + 52, y + 48))
-            self.screen.blit(cost_text, cost_rect)
+            can_afford = money >= TOWER_CONFIG[ttype]['cost']
             
-            # Hotkey indicator
-            hotkey_text = self.font_tiny.render(f"[{i+1}]", True, COLORS['quantum_coherence'])
-            hotkey_rect = hotkey_text.get_rect(center=(x + 52, y + 68))
-            self.screen.blit(hotkey_text, hotkey_rect)
+            blit_list.append((self._button_bg[(ttype, is_selected, can_afford)], (x, y)))
         
         # === RIGHT SECTION: Controls ===
         
-        # Wave start button (if wave not active)
-        if not wave_active:
-            wave_button_rect = pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 85, 140, 45)
-            pygame.draw.rect(self.screen, (80, 180, 80), wave_button_rect, border_radius=10)
-            pygame.draw.rect(self.screen, (100, 255, 100), wave_button_rect, width=3, border_radius=10)
-            
-            wave_button_text = self.font_medium.render("START WAVE", True, (0, 0, 0))
-            wave_button_text_rect = wave_button_text.get_rect(center=wave_button_rect.center)
-            self.screen.blit(wave_button_text, wave_button_text_rect)
-            
-            # Space key hint
-            space_hint = self.font_tiny.render("[SPACE]", True, (200, 255, 200))
-            space_hint_rect = space_hint.get_rect(center=(wave_button_rect.centerx, SCREEN_HEIGHT - 30))
-            self.screen.blit(space_hint, space_hint_rect)
-        
         # FPS counter
         fps_text = self.font_tiny.render(f"FPS: {int(fps)}", True, (150, 150, 150))
-        self.screen.blit(fps_text, (SCREEN_WIDTH - 80, SCREEN_HEIGHT - 95))
+        blit_list.append((fps_text, (SCREEN_WIDTH - 80, SCREEN_HEIGHT - 95)))
         
         # Score
         score_text = self.font_small.render(
-            f"Score: {resource_manager.score}",
+            f"Score: {score}",
             True,
             COLORS['ui_text']
         )
-        self.screen.blit(score_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 70))
+        blit_list.append((score_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 70)))
+        
+        self.screen.blits(blit_list, doreturn=False)
     
     def handle_click(self, pos, game):
         """
@@ -224,26 +280,37 @@ class UIManager:
             return  # Click is in game area, not UI
         
         # Tower button clicks
-        tower_types = ['measurement', 'phase', 'entanglement', 'teleportation']
-        for i, ttype in enumerate(tower_types):
-            x = 380 + i * 115
-            y = SCREEN_HEIGHT - 90
-            button_rect = pygame.Rect(x, y, 105, 80)
-            
-            if button_rect.collidepoint(pos):
-                # Check if can afford
-                if game.resource_manager.can_afford(TOWER_CONFIG[ttype]['cost']):
-                    game.selected_tower_type = ttype
-                return
+        idx = pygame.Rect(pos, (1, 1)).collidelist(self._tower_button_rects)
+        if idx != -1:
+            ttype = _TOWER_TYPES[idx]
+            # Check if can afford
+            if game.resource_manager.can_afford(TOWER_CONFIG[ttype]['cost']):
+                game.selected_tower_type = ttype
+            return
         
         # Wave start button click
         if not game.wave_manager.wave_active:
-            wave_button_rect = pygame.Rect(SCREEN_WIDTH - 160, SCREEN_HEIGHT - 85, 140, 45)
-            if wave_button_rect.collidepoint(pos):
+            if self._wave_button_rect.collidepoint(pos):
                 game.start_next_wave()
     
     def render_tutorial(self):
         """Render tutorial overlay"""
+        if self._tutorial_surface is None:
+            self._tutorial_surface = self._build_tutorial()
+        
+        # Blit overlay to screen (top-right corner)
+        self.screen.blit(
+            self._tutorial_surface,
+            (SCREEN_WIDTH - self._tutorial_surface.get_width() - 20, 20)
+        )
+    
+    def _build_tutorial(self):
+        """
+        Render the static tutorial overlay once
+        
+        Returns:
+            Tutorial overlay surface
+        """
         # Create semi-transparent overlay
         overlay_width = 500
         overlay_height = 460
@@ -284,18 +351,23 @@ class UIManager:
             ("  Phase towers shift probabilities!", False, 14, (255, 200, 100)),
         ]
         
+        # One font per (size, bold) instead of one per line
+        fonts = {}
+        
         y = 20
         for text, is_bold, size, color in tutorial_lines:
             if text:
-                font = pygame.font.Font(None, size)
-                if is_bold:
-                    font.set_bold(True)
+                font = fonts.get((size, is_bold))
+                if font is None:
+                    font = pygame.font.Font(None, size)
+                    if is_bold:
+                        font.set_bold(True)
+                    fonts[(size, is_bold)] = font
                 text_surface = font.render(text, True, color)
                 overlay.blit(text_surface, (25, y))
             y += size + 6
         
-        # Blit overlay to screen (top-right corner)
-        self.screen.blit(overlay, (SCREEN_WIDTH - overlay_width - 20, 20))
+        return overlay.convert_alpha()
     
     def render_tower_info(self, tower_type, mouse_pos):
         """
@@ -305,9 +377,26 @@ class UIManager:
             tower_type: Type of tower
             mouse_pos: Mouse position for tooltip placement
         """
-        if tower_type not in TOWER_CONFIG:
+        tooltip = self._tooltips.get(tower_type)
+        if tooltip is None:
             return
         
+        # Position tooltip near mouse
+        tooltip_x = min(mouse_pos[0] + 15, SCREEN_WIDTH - tooltip.get_width() - 10)
+        tooltip_y = max(10, mouse_pos[1] - tooltip.get_height() - 10)
+        
+        self.screen.blit(tooltip, (tooltip_x, tooltip_y))
+    
+    def _build_tooltip(self, tower_type):
+        """
+        Render the static tooltip for one tower type
+        
+        Args:
+            tower_type: Type of tower
+        
+        Returns:
+            Tooltip surface
+        """
         config = TOWER_CONFIG[tower_type]
         
         # Create tooltip
@@ -317,13 +406,7 @@ class UIManager:
         tooltip.fill((20, 20, 20, 240))
         
         # Border
-        tower_colors = {
-            'measurement': COLORS['tower_measurement'],
-            'phase': COLORS['tower_phase'],
-            'entanglement': COLORS['tower_entanglement'],
-            'teleportation': COLORS['tower_teleportation']
-        }
-        border_color = tower_colors.get(tower_type, COLORS['ui_text'])
+        border_color = _TOWER_COLORS.get(tower_type, COLORS['ui_text'])
         pygame.draw.rect(tooltip, border_color, tooltip.get_rect(), width=2, border_radius=5)
         
         # Tower name
@@ -346,8 +429,4 @@ class UIManager:
             tooltip.blit(stat_text, (10, y))
             y += 18
         
-        # Position tooltip near mouse
-        tooltip_x = min(mouse_pos[0] + 15, SCREEN_WIDTH - tooltip_width - 10)
-        tooltip_y = max(10, mouse_pos[1] - tooltip_height - 10)
-        
-        self.screen.blit(tooltip, (tooltip_x, tooltip_y))
+        return tooltip.convert_alpha()